@@ -0,0 +1,114 @@
+import csv
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from llm.gemini_explainer import DEFAULT_CONTEXT_TOKEN_BUDGET, build_context
+from section4 import (
+    TARGET_LABELS,
+    generar_lista_preguntas,
+    get_data_desc,
+    group_neighbour_results,
+    load_knn_indexes,
+    load_section4_assets,
+    obtener_vecinos_lote,
+)
+
+OUT_CSV = ROOT / "benchmarks" / "context_size_results.csv"
+N_RESPONDENTS = 200
+N_VECINOS = 50
+
+
+def respondent_questionnaires(proyeccion, variables, rng):
+    """Respuestas de personas reales del levantamiento (filas sin faltantes)."""
+    X = proyeccion["X"][:, [proyeccion["columns"][var] for var in variables]]
+    complete = np.flatnonzero(~np.isnan(X).any(axis=1))
+    rows = rng.choice(complete, size=min(N_RESPONDENTS, len(complete)), replace=False)
+    return X[rows]
+
+
+def questionnaire_rows(preguntas, respuesta):
+    rows = []
+    for pregunta, codigo in zip(preguntas, respuesta):
+        opciones = pregunta.get("opciones") or {}
+        codigo = int(codigo) if float(codigo).is_integer() else float(codigo)
+        rows.append(
+            {
+                "variable": pregunta["variable"],
+                "descripcion": pregunta["descripcion"],
+                "respuesta_codigo": codigo,
+                "respuesta_texto": opciones.get(codigo, str(codigo)),
+            }
+        )
+    return rows
+
+
+def percentiles(values):
+    return {f"p{q}": int(np.percentile(values, q)) for q in (50, 90, 99)} | {"max": int(max(values))}
+
+
+def benchmark_context_size(seed=0, token_budget=DEFAULT_CONTEXT_TOKEN_BUDGET):
+    rng = np.random.default_rng(seed)
+    base_path = str(ROOT / "data")
+    assets = load_section4_assets(base_path)
+    knn_indexes = load_knn_indexes(base_path)
+    data_desc = get_data_desc()
+    rows = []
+    for target, knn_index in knn_indexes.items():
+        variables = knn_index["variables"]
+        preguntas = generar_lista_preguntas({var: data_desc[var] for var in variables})
+        respuestas = respondent_questionnaires(assets["target_projections"][target], variables, rng)
+        df_lote = obtener_vecinos_lote(
+            respuestas, assets["df_valiosas_dict"][target], knn_index, n_vecinos=N_VECINOS
+        )
+        full_tokens, budget_tokens, groups_total, groups_included = [], [], [], []
+        for fila, df_resultados in df_lote.groupby("fila", sort=True):
+            app_state = {
+                "target": target,
+                "target_label": TARGET_LABELS.get(target, target),
+                "active_filters": [],
+                "questionnaire": questionnaire_rows(preguntas, respuestas[fila]),
+                "results": group_neighbour_results(
+                    df_resultados.drop(columns="fila"), data_desc, base_path
+                ),
+            }
+            full = build_context(app_state, token_budget=None)
+            budgeted = build_context(app_state, token_budget=token_budget)
+            full_tokens.append(full["tokens"])
+            budget_tokens.append(budgeted["tokens"])
+            groups_total.append(budgeted["groups_total"])
+            groups_included.append(budgeted["groups_included"])
+        rows.append(
+            {
+                "target": target,
+                "respondents": len(full_tokens),
+                "budget": token_budget,
+                **{f"tokens_full_{k}": v for k, v in percentiles(full_tokens).items()},
+                **{f"tokens_budget_{k}": v for k, v in percentiles(budget_tokens).items()},
+                "groups_mean": round(float(np.mean(groups_total)), 1),
+                "groups_included_mean": round(float(np.mean(groups_included)), 1),
+                "truncated_share": round(
+                    float(np.mean(np.array(groups_included) < np.array(groups_total))), 3
+                ),
+            }
+        )
+    return rows
+
+
+def main():
+    rows = benchmark_context_size()
+    with OUT_CSV.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    for row in rows:
+        print(row)
+    print(f"CSV: {OUT_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import csv
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from section4 import load_section4_assets, section4_question_sets
+from utils.knn_s4 import KNN_BACKENDS, fit_knn_index, knn_recall_at_k, query_knn_index
+
+OUT_CSV = ROOT / "benchmarks" / "knn_backends_results.csv"
+SIZES = (4_500, 50_000, 200_000)
+N_QUERIES = 500
+K = 50
+
+
+def reference_matrix(target):
+    """Filas válidas (cluster != -1) y variables del cuestionario de un target."""
+    assets = load_section4_assets(str(ROOT / "data"))
+    variables = section4_question_sets(assets)[target]
+    proyeccion = assets["target_projections"][target]
+    X = proyeccion["X"][:, [proyeccion["columns"][var] for var in variables]]
+    return np.where(np.isnan(X), np.nanmean(X, axis=0), X), proyeccion["clusters"], variables
+
+
+def grow(X, clusters, size, rng):
+    """Simula más levantamientos: remuestrea filas con ruido pequeño."""
+    rows = rng.integers(0, len(X), size)
+    noise = rng.normal(0, 0.05, (size, X.shape[1])) * X.std(axis=0)
+    return X[rows] + noise, clusters[rows]
+
+
+def benchmark_backends(target="OBJ_pobre_a_rico", seed=0):
+    rng = np.random.default_rng(seed)
+    X, clusters, variables = reference_matrix(target)
+    queries = X[rng.integers(0, len(X), N_QUERIES)]
+    rows = []
+    for size in SIZES:
+        X_size, clusters_size = grow(X, clusters, size, rng)
+        exact = None
+        for backend in KNN_BACKENDS:
+            t0 = time.perf_counter()
+            index = fit_knn_index(X_size, clusters_size, variables, backend=backend)
+            fit_seconds = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            query_knn_index(index, queries, K)
+            query_ms = (time.perf_counter() - t0) / N_QUERIES * 1000
+            if backend == "exact":
+                exact = index
+            rows.append(
+                {
+                    "rows": size,
+                    "backend": backend,
+                    "fit_seconds": round(fit_seconds, 3),
+                    "query_ms": round(query_ms, 4),
+                    f"recall_at_{K}": round(knn_recall_at_k(index, exact, queries, K), 4),
+                }
+            )
+    return rows
+
+
+def main():
+    rows = benchmark_backends()
+    with OUT_CSV.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    for row in rows:
+        print(row)
+    print(f"CSV: {OUT_CSV}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,13 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
-from data_utils import load_and_process_data, load_and_process_data_uncached
+from data_utils import (
+    load_and_process_data,
+    load_and_process_data_persisted,
+    load_and_process_data_uncached,
+    load_shared_processed_data,
+    memory_footprint,
+)
 
 OUT_CSV = ROOT / "benchmarks" / "ab_test_results.csv"
 OUT_MD = ROOT / "benchmarks" / "ab_test_report.md"
@@ -33,9 +39,17 @@ def benchmark_data_loading(repeats: int = 3):
         _ = load_and_process_data_uncached()
         uncached_times.append(time.perf_counter() - t0)
 
+    # Snapshot en disco: la primera llamada lo crea si no existe, las demás lo leen.
+    _ = load_and_process_data_persisted()
+    snapshot_times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        _ = load_and_process_data_persisted()
+        snapshot_times.append(time.perf_counter() - t0)
+
     # B: refactor (con cache)
-    if hasattr(load_and_process_data, "clear"):
-        load_and_process_data.clear()
+    if hasattr(load_shared_processed_data, "clear"):
+        load_shared_processed_data.clear()
 
     t0 = time.perf_counter()
     _ = load_and_process_data()
@@ -49,12 +63,30 @@ def benchmark_data_loading(repeats: int = 3):
 
     return {
         "uncached_avg_s": sum(uncached_times) / len(uncached_times),
+        "snapshot_load_avg_s": sum(snapshot_times) / len(snapshot_times),
         "cached_first_call_s": first_cached,
         "cached_hit_avg_s": sum(cached_hit_times) / len(cached_hit_times),
         "cache_speedup_vs_uncached_x": (sum(uncached_times) / len(uncached_times)) / max(sum(cached_hit_times) / len(cached_hit_times), 1e-9),
     }
 
 
+def benchmark_memory():
+    # A: lectura original (.dta completos, tipos sin reducir, sin compactar).
+    raw = load_and_process_data_uncached(compact=False, original_dtypes=True)
+    narrowed = load_and_process_data_uncached(compact=False)
+    compact = load_and_process_data_uncached(compact=True)
+    raw_bytes = memory_footprint(raw)["total_bytes"]
+    narrowed_bytes = memory_footprint(narrowed)["total_bytes"]
+    compact_bytes = memory_footprint(compact)["total_bytes"]
+    return {
+        "raw_mb": raw_bytes / 1024**2,
+        "narrowed_mb": narrowed_bytes / 1024**2,
+        "compact_mb": compact_bytes / 1024**2,
+        "narrowed_reduction_x": raw_bytes / max(narrowed_bytes, 1),
+        "reduction_x": raw_bytes / max(compact_bytes, 1),
+    }
+
+
 def main():
     baseline_source = subprocess.check_output(
         ["git", "show", "HEAD:section4.py"],
@@ -66,6 +98,7 @@ def main():
     baseline_metrics = section4_static_metrics(baseline_source)
     refactor_metrics = section4_static_metrics(refactor_source)
     perf_metrics = benchmark_data_loading(repeats=3)
+    memory_metrics = benchmark_memory()
 
     rows = [
         ["area", "variant", "metric", "value"],
@@ -76,9 +109,15 @@ def main():
         ["section4", "B_refactor", "function_defs", refactor_metrics["function_defs"]],
         ["section4", "B_refactor", "duplicate_function_defs", refactor_metrics["duplicate_function_defs"]],
         ["data_loading", "A_baseline_uncached", "avg_call_seconds", f"{perf_metrics['uncached_avg_s']:.6f}"],
+        ["data_loading", "B_refactor_snapshot", "avg_call_seconds", f"{perf_metrics['snapshot_load_avg_s']:.6f}"],
         ["data_loading", "B_refactor_cached", "first_call_seconds", f"{perf_metrics['cached_first_call_s']:.6f}"],
         ["data_loading", "B_refactor_cached", "cache_hit_avg_seconds", f"{perf_metrics['cached_hit_avg_s']:.6f}"],
         ["data_loading", "B_refactor_cached", "speedup_cache_hit_vs_uncached_x", f"{perf_metrics['cache_speedup_vs_uncached_x']:.2f}"],
+        ["memory", "A_baseline_raw", "frame_mb", f"{memory_metrics['raw_mb']:.3f}"],
+        ["memory", "B_refactor_narrowed_read", "frame_mb", f"{memory_metrics['narrowed_mb']:.3f}"],
+        ["memory", "B_refactor_narrowed_read", "reduction_x", f"{memory_metrics['narrowed_reduction_x']:.2f}"],
+        ["memory", "B_refactor_compact", "frame_mb", f"{memory_metrics['compact_mb']:.3f}"],
+        ["memory", "B_refactor_compact", "reduction_x", f"{memory_metrics['reduction_x']:.2f}"],
     ]
 
     with OUT_CSV.open("w", newline="", encoding="utf-8") as f:
@@ -91,8 +130,10 @@ def main():
 - `section4.py` redujo tamaño de **{baseline_metrics['line_count']}** a **{refactor_metrics['line_count']}** líneas.
 - Definiciones de función duplicadas pasaron de **{baseline_metrics['duplicate_function_defs']}** a **{refactor_metrics['duplicate_function_defs']}**.
 - Carga de datos: promedio baseline sin caché **{perf_metrics['uncached_avg_s']:.4f}s**.
+- Carga desde snapshot Parquet en disco (arranque en frío de un worker): **{perf_metrics['snapshot_load_avg_s']:.4f}s**.
 - Carga cacheada: primer llamado **{perf_metrics['cached_first_call_s']:.4f}s**, hit de caché promedio **{perf_metrics['cached_hit_avg_s']:.4f}s**.
 - Aceleración en hits de caché: **{perf_metrics['cache_speedup_vs_uncached_x']:.2f}x**.
+- Memoria del DataFrame procesado: **{memory_metrics['raw_mb']:.2f} MB** con la lectura original, **{memory_metrics['narrowed_mb']:.2f} MB** leyendo sólo las columnas necesarias con tipos reducidos (**{memory_metrics['narrowed_reduction_x']:.1f}x** menos) y **{memory_metrics['compact_mb']:.2f} MB** compactado (**{memory_metrics['reduction_x']:.1f}x** menos).
 
 ## Archivos de salida
 - CSV de métricas: `benchmarks/ab_test_results.csv`
@@ -1,113 +1,305 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import streamlit as st
 
+from config import POSSIBLE_VARS, VAR_CATEGORIES
+
+FILE_PATH_PERSON = "data/ESRU-EMOVI 2017 Entrevistado.dta"
+FILE_PATH_HOGAR = "data/ESRU-EMOVI 2017 Hogar.dta"
+SNAPSHOT_DIR = "data/cache"
+
+# Incrementar cada vez que cambie la salida de load_and_process_data_uncached
+# para invalidar los snapshots en disco generados con la versión anterior.
+PIPELINE_VERSION = 3
+
+MERGE_KEYS = ["folio", "consecutivo"]
+# Columnas que se toman de la base de hogares; el resto sale de la de personas.
+HOGAR_COLUMNS = ["p05h", "p06h"]
+
+A_LOS_14_VARS = [
+    "p30_a",
+    "p30_b",
+    "p30_c",
+    "p30_d",
+    "p30_e",
+    "p32_a",
+    "p32_b",
+    "p32_c",
+    "p32_d",
+    "p33_a",
+    "p33_b",
+    "p33_c",
+    "p33_d",
+    "p33_e",
+    "p33_f",
+    "p33_g",
+    "p33_h",
+    "p33_i",
+    "p33_j",
+    "p33_k",
+    "p33_l",
+    "p33_m",
+    "p33_n",
+    "p34_a",
+    "p34_b",
+    "p34_c",
+    "p34_d",
+    "p34_e",
+    "p34_f",
+    "p34_g",
+    "p34_h",
+]
+
+ACTUALMENTE_VARS = [
+    "p125a",
+    "p125b",
+    "p125c",
+    "p125d",
+    "p125e",
+    "p126a",
+    "p126b",
+    "p126c",
+    "p126d",
+    "p126e",
+    "p126f",
+    "p126g",
+    "p126h",
+    "p126i",
+    "p126j",
+    "p126k",
+    "p126l",
+    "p126m",
+    "p126n",
+    "p126o",
+    "p126p",
+    "p126q",
+    "p126r",
+    "p129a",
+    "p129b",
+    "p129c",
+    "p129d",
+    "p129e",
+    "p131",
+]
+
+# Reglas declarativas para variables derivadas. Cada regla toma la columna
+# "source" y la recodifica en una sola pasada vectorizada:
+#   - "bins": cortes inclusivos por arriba; el valor v recibe labels[i] con
+#     i = número de cortes estrictamente menores que v ("truncate" replica int(v)).
+#   - "map": códigos -> etiqueta; lo no mapeado recibe "default".
+# Los valores faltantes reciben "na" en ambos casos.
+DERIVED_VARIABLE_RULES = {
+    "generation": {
+        "source": "p05h",
+        "bins": [20, 36, 52, 71],
+        "labels": ["Gen Z", "Millennial", "Gen X", "Baby Boomer", "Traditionalist"],
+        "truncate": True,
+        "na": "NA",
+    },
+    "sex": {
+        "source": "p06h",
+        "map": {1: "Hombre", 2: "Mujer"},
+        "default": np.nan,
+        "na": np.nan,
+    },
+    "education": {
+        "source": "p07",
+        "map": {
+            1: "Primaria",
+            2: "Secundaria",
+            3: "Preparatoria",
+            4: "Universidad",
+            5: "Posgrado",
+        },
+        "default": "Otro",
+        "na": "NA",
+    },
+}
 
-def load_and_process_data_uncached():
+
+def recode_binary(df, columns, threshold=None):
     """
-    Lee los archivos .dta, hace merge y crea las variables necesarias.
-    Esta versión no cachea resultados y se mantiene para AB testing.
+    Recodifica un bloque de columnas a indicadores 0/1 en una sola pasada NumPy.
+    Sin threshold: 1 si el valor es exactamente 1 (faltantes y demás códigos -> 0).
+    Con threshold: 1 si el valor es >= threshold (faltantes -> 0).
     """
-    file_path_person = "data/ESRU-EMOVI 2017 Entrevistado.dta"
-    file_path_hogar = "data/ESRU-EMOVI 2017 Hogar.dta"
+    if not columns:
+        return df
+    block = df[columns].to_numpy(dtype="float64")
+    if threshold is None:
+        indicators = block == 1
+    else:
+        indicators = np.nan_to_num(block, nan=0.0) >= threshold
+    df[columns] = indicators.astype("int64")
+    return df
 
-    df_person = pd.read_stata(file_path_person, convert_categoricals=False)
-    df_hogar = pd.read_stata(file_path_hogar, convert_categoricals=False)
 
-    df = pd.merge(
-        df_person,
-        df_hogar[["folio", "consecutivo", "p05h", "p06h"]],
-        on=["folio", "consecutivo"],
-        how="left",
-    )
+def recode_column(values, rule):
+    """Aplica una regla de DERIVED_VARIABLE_RULES a un arreglo y devuelve etiquetas."""
+    values = np.asarray(values, dtype="float64")
+    missing = np.isnan(values)
+
+    if "bins" in rule:
+        if rule.get("truncate"):
+            values = np.trunc(values)
+        labels = np.asarray(rule["labels"], dtype=object)
+        positions = np.searchsorted(np.asarray(rule["bins"], dtype="float64"), values, side="left")
+        out = labels[np.minimum(positions, len(labels) - 1)]
+    else:
+        conditions = [values == code for code in rule["map"]]
+        choices = [np.full(values.shape, label, dtype=object) for label in rule["map"].values()]
+        out = np.select(conditions, choices, default=rule.get("default", np.nan))
+        out = out.astype(object)
+
+    out[missing] = rule.get("na", np.nan)
+    return out
+
+
+def apply_recode_rules(df, rules):
+    """
+    Agrega al DataFrame las variables derivadas declaradas en rules.
+    Las reglas cuya columna fuente no existe se omiten.
+    """
+    for target, rule in rules.items():
+        if rule["source"] not in df.columns:
+            continue
+        df[target] = pd.Series(recode_column(df[rule["source"]], rule), index=df.index)
+    return df
 
-    a_los_14_vars = [
-        "p30_a",
-        "p30_b",
-        "p30_c",
-        "p30_d",
-        "p30_e",
-        "p32_a",
-        "p32_b",
-        "p32_c",
-        "p32_d",
-        "p33_a",
-        "p33_b",
-        "p33_c",
-        "p33_d",
-        "p33_e",
-        "p33_f",
-        "p33_g",
-        "p33_h",
-        "p33_i",
-        "p33_j",
-        "p33_k",
-        "p33_l",
-        "p33_m",
-        "p33_n",
-        "p34_a",
-        "p34_b",
-        "p34_c",
-        "p34_d",
-        "p34_e",
-        "p34_f",
-        "p34_g",
-        "p34_h",
-    ]
 
-    actualmente_vars = [
-        "p125a",
-        "p125b",
-        "p125c",
-        "p125d",
-        "p125e",
-        "p126a",
-        "p126b",
-        "p126c",
-        "p126d",
-        "p126e",
-        "p126f",
-        "p126g",
-        "p126h",
-        "p126i",
-        "p126j",
-        "p126k",
-        "p126l",
-        "p126m",
-        "p126n",
-        "p126o",
-        "p126p",
-        "p126q",
-        "p126r",
-        "p129a",
-        "p129b",
-        "p129c",
-        "p129d",
-        "p129e",
-        "p131",
+def required_source_columns():
+    """
+    Columnas que el pipeline necesita de cada .dta, derivadas de las listas de
+    activos y de las fuentes declaradas en DERIVED_VARIABLE_RULES.
+    Devuelve (columnas_persona, columnas_hogar).
+    """
+    rule_sources = [rule["source"] for rule in DERIVED_VARIABLE_RULES.values()]
+    person = MERGE_KEYS + A_LOS_14_VARS + ACTUALMENTE_VARS + [
+        col for col in rule_sources if col not in HOGAR_COLUMNS
     ]
+    hogar = MERGE_KEYS + HOGAR_COLUMNS
+    return list(dict.fromkeys(person)), list(dict.fromkeys(hogar))
+
+
+def narrow_dtypes(df, exclude=()):
+    """
+    Reduce el tipo de las columnas numéricas: enteros al menor tipo posible
+    (int8 para los códigos de respuesta) y columnas con faltantes a float32.
+    """
+    for col in df.columns:
+        if col in exclude or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        serie = df[col]
+        if serie.isna().any():
+            df[col] = serie.astype("float32")
+        else:
+            df[col] = pd.to_numeric(serie, downcast="integer")
+    return df
+
+
+def read_stata_columns(path, columns):
+    """
+    Lee sólo las columnas indicadas de un .dta (las que no existan se ignoran)
+    y reduce sus tipos al leer. Usa pyreadstat (usecols) si está disponible;
+    si no, pd.read_stata con columns=.
+    """
+    try:
+        import pyreadstat
+    except ImportError:
+        pyreadstat = None
+
+    if pyreadstat is not None:
+        _, meta = pyreadstat.read_dta(path, metadataonly=True)
+        usecols = [col for col in columns if col in meta.column_names]
+        df, _ = pyreadstat.read_dta(path, usecols=usecols, apply_value_formats=False)
+    else:
+        with pd.read_stata(path, iterator=True) as reader:
+            available = set(reader.variable_labels())
+        usecols = [col for col in columns if col in available]
+        df = pd.read_stata(path, columns=usecols, convert_categoricals=False)
 
-    def recodificar_01(valor):
-        if pd.isna(valor):
-            return 0
-        if valor == 1:
-            return 1
-        return 0
+    return narrow_dtypes(df, exclude=MERGE_KEYS)
 
-    for var in a_los_14_vars:
-        if var in df.columns:
-            df[var] = df[var].apply(recodificar_01)
 
-    for var in actualmente_vars:
-        if var in df.columns and var != "p131":
-            df[var] = df[var].apply(recodificar_01)
+def compact_processed_frame(df):
+    """
+    Reduce la huella en memoria del DataFrame procesado:
+      - indicadores 0/1 de activos -> int8
+      - sumas de riqueza -> menor entero sin signo
+      - quintiles -> uint8 (si no hay faltantes)
+      - generation/sex/education -> pd.Categorical, con el orden de
+        config.VAR_CATEGORIES y al final cualquier otra categoría observada.
+    """
+    indicator_cols = [c for c in A_LOS_14_VARS + ACTUALMENTE_VARS if c in df.columns]
+    df[indicator_cols] = df[indicator_cols].astype("int8")
+
+    for col in ["a_los_14_wealth", "actualmente_wealth", "actualmente_wealth2"]:
+        df[col] = pd.to_numeric(df[col], downcast="unsigned")
+
+    for col in ["a_los_14_quintile", "actualmente_quintile"]:
+        if df[col].notna().all():
+            df[col] = df[col].astype("uint8")
+
+    for col, categories in VAR_CATEGORIES.items():
+        if col not in df.columns:
+            continue
+        observed = df[col].dropna().unique()
+        extra = sorted(str(v) for v in observed if v not in categories)
+        df[col] = pd.Categorical(df[col], categories=list(categories) + extra)
+
+    return df
+
+
+def memory_footprint(df):
+    """
+    Bytes que ocupa el DataFrame (incluye el contenido de columnas object).
+    Devuelve {"total_bytes": int, "per_column": {columna: bytes}}.
+    """
+    per_column = df.memory_usage(deep=True, index=True)
+    return {
+        "total_bytes": int(per_column.sum()),
+        "per_column": {str(k): int(v) for k, v in per_column.items()},
+    }
+
 
+def load_and_process_data_uncached(compact=True, original_dtypes=False):
+    """
+    Lee los archivos .dta, hace merge y crea las variables necesarias.
+    Esta versión no cachea resultados y se mantiene para AB testing.
+    Con compact=False se omite compact_processed_frame (útil para medir memoria).
+    Con original_dtypes=True se leen los .dta completos y sin reducir tipos,
+    como la lectura original (línea base de memoria del AB testing).
+    """
+    if original_dtypes:
+        df_person = pd.read_stata(FILE_PATH_PERSON, convert_categoricals=False)
+        df_hogar = pd.read_stata(FILE_PATH_HOGAR, convert_categoricals=False)
+    else:
+        person_columns, hogar_columns = required_source_columns()
+        df_person = read_stata_columns(FILE_PATH_PERSON, person_columns)
+        df_hogar = read_stata_columns(FILE_PATH_HOGAR, hogar_columns)
+
+    df = pd.merge(
+        df_person,
+        df_hogar[MERGE_KEYS + HOGAR_COLUMNS],
+        on=MERGE_KEYS,
+        how="left",
+    )
+
+    df = recode_binary(df, [v for v in A_LOS_14_VARS if v in df.columns])
+    df = recode_binary(
+        df, [v for v in ACTUALMENTE_VARS if v in df.columns and v != "p131"]
+    )
     if "p131" in df.columns:
-        df["p131"] = df["p131"].fillna(0)
-        df["p131"] = np.where(df["p131"] >= 1, 1, 0)
+        df = recode_binary(df, ["p131"], threshold=1)
 
-    df["a_los_14_wealth"] = df[a_los_14_vars].sum(axis=1)
-    df["actualmente_wealth"] = df[actualmente_vars].sum(axis=1)
+    df["a_los_14_wealth"] = df[A_LOS_14_VARS].sum(axis=1)
+    df["actualmente_wealth"] = df[ACTUALMENTE_VARS].sum(axis=1)
     df["actualmente_wealth2"] = df["actualmente_wealth"]
 
     def asignar_quintil(serie):
@@ -116,50 +308,142 @@ def load_and_process_data_uncached():
     df["a_los_14_quintile"] = asignar_quintil(df["a_los_14_wealth"])
     df["actualmente_quintile"] = asignar_quintil(df["actualmente_wealth2"])
 
-    def assign_generation(age):
-        if pd.isna(age):
-            return "NA"
-        age = int(age)
-        if age <= 20:
-            return "Gen Z"
-        if 21 <= age <= 36:
-            return "Millennial"
-        if 37 <= age <= 52:
-            return "Gen X"
-        if 53 <= age <= 71:
-            return "Baby Boomer"
-        return "Traditionalist"
-
-    df["generation"] = df["p05h"].apply(assign_generation)
-    df["sex"] = df["p06h"].map({1: "Hombre", 2: "Mujer"})
-
-    def assign_education(val):
-        if pd.isna(val):
-            return "NA"
-        if val == 1:
-            return "Primaria"
-        if val == 2:
-            return "Secundaria"
-        if val == 3:
-            return "Preparatoria"
-        if val == 4:
-            return "Universidad"
-        if val == 5:
-            return "Posgrado"
-        return "Otro"
-
-    if "p07" in df.columns:
-        df["education"] = df["p07"].apply(assign_education)
-    else:
+    df = apply_recode_rules(df, DERIVED_VARIABLE_RULES)
+
+    if "education" not in df.columns:
         df["education"] = np.random.choice(
             ["Primaria", "Secundaria", "Preparatoria", "Universidad", "Posgrado", "Otro", "NA"],
             size=len(df),
         )
 
+    if compact:
+        df = compact_processed_frame(df)
     return df
 
 
-@st.cache_data(show_spinner=False)
+def source_fingerprint(paths=(FILE_PATH_PERSON, FILE_PATH_HOGAR)):
+    """
+    Huella de las fuentes (nombre, tamaño y mtime) más PIPELINE_VERSION.
+    Cambia en cuanto se reemplaza un .dta o se modifica el pipeline.
+    """
+    parts = {"pipeline_version": PIPELINE_VERSION, "sources": []}
+    for path in paths:
+        stat = os.stat(path)
+        parts["sources"].append([Path(path).name, stat.st_size, stat.st_mtime_ns])
+    payload = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def snapshot_path(snapshot_dir=SNAPSHOT_DIR):
+    """Ruta del snapshot Parquet correspondiente a las fuentes actuales."""
+    return Path(snapshot_dir) / f"emovi_processed_{source_fingerprint()}.parquet"
+
+
+def _write_snapshot(df, path):
+    """
+    Escribe el snapshot de forma atómica (archivo temporal + os.replace) para
+    que otros procesos nunca lean un Parquet a medio escribir.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_name, index=False)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+
+    # Limpia snapshots de versiones/fuentes anteriores.
+    for old in path.parent.glob("emovi_processed_*.parquet"):
+        if old != path:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+
+def load_and_process_data_persisted(snapshot_dir=SNAPSHOT_DIR):
+    """
+    Devuelve el DataFrame procesado leyendo un snapshot Parquet en disco.
+    Si no existe (o las fuentes/pipeline cambiaron) se reconstruye con
+    load_and_process_data_uncached y se guarda para los siguientes procesos.
+    """
+    path = snapshot_path(snapshot_dir)
+    if path.exists():
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            pass
+
+    df = load_and_process_data_uncached()
+    try:
+        _write_snapshot(df, path)
+    except Exception:
+        # Sin permisos de escritura (u otro error de disco) sólo se pierde el snapshot.
+        pass
+    return df
+
+
+# Los frames que se entregan a las sesiones son vistas copy-on-write del frame
+# compartido. pandas >= 3 siempre usa copy-on-write; en pandas 2 se activa.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@st.cache_resource(show_spinner=False)
+def load_shared_processed_data():
+    """
+    DataFrame procesado, uno solo por proceso (respaldado por el snapshot en
+    disco). No se entrega directamente a las secciones: ver load_and_process_data.
+    """
+    return load_and_process_data_persisted()
+
+
 def load_and_process_data():
-    """Versión cacheada para Streamlit."""
-    return load_and_process_data_uncached()
+    """
+    Versión cacheada para Streamlit. Devuelve una vista copy-on-write
+    (df.copy(deep=False)) del frame compartido: no copia los datos, y
+    cualquier cambio que haga una sección (columnas nuevas, asignaciones,
+    inplace=True) se queda en su vista sin tocar el frame de las demás sesiones.
+    """
+    return load_shared_processed_data().copy(deep=False)
+
+
+def build_filter_index(df, variables=POSSIBLE_VARS):
+    """
+    Índice de bitmaps para filtrar sin copiar el DataFrame: para cada variable
+    y categoría observada guarda un arreglo booleano con las filas que la tienen.
+    """
+    bitmaps = {}
+    for var in variables:
+        if var not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[var])
+        bitmaps[var] = {str(cat): codes == i for i, cat in enumerate(uniques)}
+    return {"n_rows": len(df), "bitmaps": bitmaps}
+
+
+def filter_mask(index, selection):
+    """
+    Evalúa selection ({variable: [categorías]}) sobre el índice de bitmaps:
+    OR entre categorías de una variable y AND entre variables.
+    Devuelve la máscara booleana de filas que cumplen el filtro.
+    """
+    mask = np.ones(index["n_rows"], dtype=bool)
+    for var, chosen_cats in selection.items():
+        if not chosen_cats or var not in index["bitmaps"]:
+            continue
+        var_mask = np.zeros(index["n_rows"], dtype=bool)
+        for cat in chosen_cats:
+            bitmap = index["bitmaps"][var].get(str(cat))
+            if bitmap is not None:
+                var_mask |= bitmap
+        mask &= var_mask
+    return mask
+
+
+@st.cache_resource(show_spinner=False)
+def load_filter_index():
+    """Índice de bitmaps del frame compartido, construido una vez por proceso."""
+    return build_filter_index(load_shared_processed_data())
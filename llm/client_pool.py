@@ -0,0 +1,348 @@
+import hashlib
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from llm.providers import ExplanationProvider, FakeProvider, GeminiProvider
+
+# Clientes de LLM de larga vida, compartidos por todas las sesiones:
+# - ClientPool guarda un proveedor por credencial (por hash de la clave; la
+#   clave no se guarda en claro como llave).
+# - ResilientProvider envuelve a cualquier proveedor (Gemini o uno local para
+#   pruebas) con concurrencia acotada, reintentos con backoff exponencial y
+#   jitter en errores transitorios, y un circuit breaker que falla de
+#   inmediato mientras el proveedor está degradado.
+# - LLMMetrics lleva latencias y errores por llamada (ClientPool.report()).
+
+# Códigos HTTP que vale la pena reintentar (límite de cuota y fallas del servidor).
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+# Excepciones transitorias. google-genai reporta las fallas de red (incluido
+# el timeout de LLM_TIMEOUT_SECONDS) como excepciones de httpx y los 5xx como
+# ServerError; ambas dependencias son opcionales aquí.
+RETRYABLE_ERRORS: tuple = (TimeoutError, ConnectionError)
+try:
+    import httpx
+
+    RETRYABLE_ERRORS += (httpx.TimeoutException, httpx.TransportError)
+except ImportError:
+    pass
+try:
+    from google.genai import errors as genai_errors
+
+    RETRYABLE_ERRORS += (genai_errors.ServerError,)
+except ImportError:
+    pass
+
+
+class CircuitOpen(RuntimeError):
+    """El proveedor falló repetidamente; no se intenta hasta reset_seconds después."""
+
+
+class PoolSaturated(RuntimeError):
+    """No se liberó un lugar de concurrencia a tiempo."""
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Errores transitorios: RETRYABLE_ERRORS y los códigos de RETRYABLE_STATUS."""
+    if isinstance(exc, RETRYABLE_ERRORS):
+        return True
+    code = getattr(exc, "code", None)
+    if code is None:
+        code = getattr(exc, "status_code", None)
+    return code in RETRYABLE_STATUS
+
+
+class CircuitBreaker:
+    """
+    closed: pasan todas las llamadas. Tras failure_threshold fallas seguidas
+    pasa a open y rechaza durante reset_seconds; luego half_open deja pasar
+    una sola llamada de prueba a la vez y rechaza las demás: un éxito lo
+    cierra y una falla lo vuelve a abrir. Si la prueba termina sin veredicto
+    (error no transitorio o stream abandonado), release_probe deja pasar otra.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[str]:
+        """None si rechaza la llamada; "probe" si es la prueba de half_open; si no, "call"."""
+        with self._lock:
+            if self.state == "open" and self.clock() - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+            if self.state == "closed":
+                return "call"
+            if self.state == "half_open" and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return "probe"
+            return None
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.probe_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = self.clock()
+
+
+class LLMMetrics:
+    """Contadores y latencias (últimas `window` llamadas) de las llamadas al LLM."""
+
+    def __init__(self, window: int = 1000):
+        self.counts: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.latencies_ms: deque = deque(maxlen=window)
+        self.first_chunk_ms: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str, latency_ms: Optional[float] = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+            if latency_ms is not None:
+                self.latencies_ms.append(latency_ms)
+            if error is not None:
+                self.errors[type(error).__name__] += 1
+
+    def record_first_chunk(self, latency_ms: float) -> None:
+        with self._lock:
+            self.first_chunk_ms.append(latency_ms)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.counts["retries"] += 1
+
+    @staticmethod
+    def _percentile(values, q: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = list(self.latencies_ms)
+            first_chunk = list(self.first_chunk_ms)
+            return {
+                "calls": self.counts["ok"] + self.counts["error"] + self.counts["rejected"],
+                "ok": self.counts["ok"],
+                "error": self.counts["error"],
+                "rejected": self.counts["rejected"],
+                "retries": self.counts["retries"],
+                "errors_by_type": dict(self.errors),
+                "latency_p50_ms": self._percentile(latencies, 0.5),
+                "latency_p95_ms": self._percentile(latencies, 0.95),
+                "first_chunk_p50_ms": self._percentile(first_chunk, 0.5),
+                "first_chunk_p95_ms": self._percentile(first_chunk, 0.95),
+            }
+
+
+class ResilientProvider:
+    """
+    Misma interfaz que el proveedor envuelto (generate/stream). Un stream
+    solo se reintenta si falló antes del primer fragmento.
+    """
+
+    def __init__(
+        self,
+        provider: ExplanationProvider,
+        slots: threading.BoundedSemaphore,
+        breaker: CircuitBreaker,
+        metrics: LLMMetrics,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        acquire_timeout: Optional[float] = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.provider = provider
+        self.slots = slots
+        self.breaker = breaker
+        self.metrics = metrics
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.acquire_timeout = acquire_timeout
+        self.sleep = sleep
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Backoff exponencial con jitter completo: uniforme en [0, min(max, base·2^intento)]."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @contextmanager
+    def _slot(self):
+        if not self.slots.acquire(timeout=self.acquire_timeout):
+            raise PoolSaturated("sin lugar para otra llamada al LLM")
+        try:
+            yield
+        finally:
+            self.slots.release()
+
+    def _check_breaker(self) -> bool:
+        """Lanza CircuitOpen si el breaker rechaza; devuelve si la llamada es la prueba."""
+        admitted = self.breaker.allow()
+        if admitted is None:
+            error = CircuitOpen("proveedor de LLM degradado")
+            self.metrics.record("rejected", error=error)
+            raise error
+        return admitted == "probe"
+
+    def _should_retry(self, exc: BaseException, attempt: int, start: float, can_retry: bool = True) -> bool:
+        """Cuenta el reintento, o la falla definitiva (en métricas y en el breaker)."""
+        retryable = is_retryable(exc)
+        if retryable and can_retry and attempt < self.max_retries:
+            self.metrics.record_retry()
+            return True
+        if retryable:
+            self.breaker.record_failure()
+        self.metrics.record("error", (time.perf_counter() - start) * 1000, exc)
+        return False
+
+    def generate(self, model: str, system_instruction: str, contents: str) -> str:
+        probe = self._check_breaker()
+        start = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    with self._slot():
+                        text = self.provider.generate(model, system_instruction, contents)
+                except Exception as exc:
+                    if not self._should_retry(exc, attempt, start):
+                        raise
+                    self.sleep(self.backoff_seconds(attempt))
+                    continue
+                self.breaker.record_success()
+                self.metrics.record("ok", (time.perf_counter() - start) * 1000)
+                return text
+        finally:
+            if probe:
+                self.breaker.release_probe()
+
+    def stream(self, model: str, system_instruction: str, contents: str) -> Iterator[str]:
+        probe = self._check_breaker()
+        start = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                produced = False
+                try:
+                    with self._slot():
+                        for chunk in self.provider.stream(model, system_instruction, contents):
+                            if not produced:
+                                produced = True
+                                self.metrics.record_first_chunk((time.perf_counter() - start) * 1000)
+                            yield chunk
+                except Exception as exc:
+                    if not self._should_retry(exc, attempt, start, can_retry=not produced):
+                        raise
+                    self.sleep(self.backoff_seconds(attempt))
+                    continue
+                self.breaker.record_success()
+                self.metrics.record("ok", (time.perf_counter() - start) * 1000)
+                return
+        finally:
+            # Sin veredicto (error no transitorio o stream abandonado) la
+            # prueba se libera para que pase otra.
+            if probe:
+                self.breaker.release_probe()
+
+
+class ClientPool:
+    """
+    Un ResilientProvider por credencial, creado con factory(api_key) la
+    primera vez que se pide. Todos comparten la concurrencia máxima, el
+    circuit breaker y las métricas del pool.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], ExplanationProvider] = GeminiProvider,
+        requires_key: bool = True,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+    ):
+        self.factory = factory
+        self.requires_key = requires_key
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self.metrics = LLMMetrics()
+        self._clients: dict[str, ResilientProvider] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ClientPool":
+        """
+        Configuración desde variables de entorno: EXPLANATION_PROVIDER=fake
+        (proveedor local, sin red ni clave), LLM_MAX_CONCURRENCY, LLM_MAX_RETRIES,
+        LLM_BREAKER_FAILURES, LLM_BREAKER_RESET_SECONDS y LLM_TIMEOUT_SECONDS.
+        """
+        timeout = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+        fake = os.getenv("EXPLANATION_PROVIDER", "").strip().lower() == "fake"
+        return cls(
+            factory=(
+                (lambda _key: FakeProvider(first_token_delay=0.3, chunk_delay=0.02))
+                if fake
+                else (lambda key: GeminiProvider(key, timeout_seconds=timeout))
+            ),
+            requires_key=not fake,
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "4")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "3")),
+            failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "5")),
+            reset_seconds=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30")),
+        )
+
+    def get(self, api_key: Optional[str]) -> Optional[ResilientProvider]:
+        """
+        Proveedor compartido para la credencial; None si hace falta clave y
+        no hay. Lanza ImportError si falta google-genai.
+        """
+        if self.requires_key and not api_key:
+            return None
+        credential = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+        with self._lock:
+            client = self._clients.get(credential)
+            if client is None:
+                client = ResilientProvider(
+                    self.factory(api_key),
+                    self.slots,
+                    self.breaker,
+                    self.metrics,
+                    max_retries=self.max_retries,
+                    backoff_base=self.backoff_base,
+                    backoff_max=self.backoff_max,
+                )
+                self._clients[credential] = client
+        return client
+
+    def report(self) -> dict:
+        """Métricas del pool más el estado del breaker y el número de clientes."""
+        with self._lock:
+            n_clients = len(self._clients)
+        return {**self.metrics.snapshot(), "breaker": self.breaker.state, "clients": n_clients}
@@ -0,0 +1,38 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+# Ejecutor en segundo plano para las llamadas al LLM. Así la app dibuja los
+# resultados deterministas de inmediato y la explicación llega después.
+# Está acotado: max_workers llamadas simultáneas y, como máximo, max_pending
+# tareas entre activas y en cola. Cuando está lleno, submit lanza
+# ExecutorBusy en lugar de encolar sin límite.
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PENDING = 32
+
+
+class ExecutorBusy(RuntimeError):
+    pass
+
+
+class BoundedExecutor:
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, max_pending: int = DEFAULT_MAX_PENDING):
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="explainer")
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorBusy(f"{self.max_pending} tareas pendientes")
+        try:
+            future = self._pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,315 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Caché de explicaciones del LLM. La llave es un hash canónico del texto de
+# contexto que de verdad se envía al modelo (build_context_text: target,
+# filtros, cuestionario y resultados) más el nombre del modelo; la clave de
+# API no forma parte de la llave. Solo comparten explicación las peticiones con
+# el mismo cuestionario, target y filtros (reruns, recargas, respuestas
+# idénticas), no las que solo coinciden en los grupos de resultados.
+#
+# - Backend en memoria (LRU con TTL) o SQLite en disco (sobrevive reinicios y
+#   se comparte entre procesos del mismo host).
+# - Las fallas concurrentes idénticas se agrupan: solo la primera llama al
+#   modelo y las demás siguen su texto, también en streaming.
+# - Una tarea en cola solo se cancela cuando la abandonan todos sus lectores
+#   (ExplanationCache.leave); una llamada que ya empezó termina y se guarda.
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 1800
+
+
+def explanation_key(context_text: str, model_name: str) -> str:
+    payload = json.dumps(
+        {"context": context_text, "model": model_name},
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryBackend:
+    """LRU en memoria con TTL; thread-safe."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._items: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            created, value = item
+            if self.ttl_seconds is not None and time.time() - created > self.ttl_seconds:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._items[key] = (time.time(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteBackend:
+    """
+    Misma interfaz que MemoryBackend sobre un archivo SQLite. El orden LRU se
+    lleva con la columna accessed; las entradas vencidas se borran al leerlas
+    y al escribir.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS explanations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS explanations_accessed ON explanations (accessed)"
+            )
+
+    def _expired_before(self) -> float:
+        return -1.0 if self.ttl_seconds is None else time.time() - self.ttl_seconds
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, created FROM explanations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if created < self._expired_before():
+                self._conn.execute("DELETE FROM explanations WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE explanations SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO explanations (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM explanations WHERE created < ?", (self._expired_before(),)
+            )
+            self._conn.execute(
+                "DELETE FROM explanations WHERE key NOT IN "
+                "(SELECT key FROM explanations ORDER BY accessed DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM explanations").fetchone()[0]
+
+
+class InflightText:
+    """
+    Texto en producción: el productor publica fragmentos y cualquier número
+    de lectores los siguen desde el inicio conforme llegan. followers cuenta
+    los lectores que no lo han abandonado y future es la tarea del productor
+    (la lleva ExplanationCache, bajo su lock).
+    """
+
+    def __init__(self):
+        self.chunks: list[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+        self.future: Optional[Future] = None
+        self._cond = threading.Condition()
+
+    def publish(self, chunk: str) -> None:
+        with self._cond:
+            self.chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        with self._cond:
+            self.done = True
+            self.error = error
+            self._cond.notify_all()
+
+    def follow(self, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Fragmentos desde el primero. Lanza TimeoutError si pasan timeout
+        segundos sin un fragmento nuevo, y el error del productor si falló.
+        """
+        pos = 0
+        while True:
+            with self._cond:
+                if not self._cond.wait_for(lambda: pos < len(self.chunks) or self.done, timeout):
+                    raise TimeoutError("sin fragmentos nuevos")
+                new = self.chunks[pos:]
+                done, error = self.done, self.error
+            pos += len(new)
+            yield from new
+            if done:
+                if error is not None:
+                    raise error
+                return
+
+    def text(self) -> str:
+        return "".join(self.follow())
+
+
+class ExplanationCache:
+    """
+    Caché con agrupación de llamadas en vuelo: por llave solo hay un
+    productor a la vez y las demás peticiones siguen su texto.
+    - get_or_compute(key, compute): valor guardado o compute() en este hilo.
+    - stream(key, produce, submit): fragmentos guardados o de produce(), que
+      se consume en segundo plano con submit (p. ej. BoundedExecutor.submit).
+    - leave(key, inflight): el lector de stream ya no quiere el texto.
+    Solo se guardan los textos para los que should_cache(texto) es verdadero
+    (p. ej. no los mensajes de error).
+    """
+
+    def __init__(self, backend=None, should_cache: Callable[[str], bool] = bool):
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.should_cache = should_cache
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+        self._inflight: dict[str, InflightText] = {}
+        # Reentrante: cancelar una tarea en leave ejecuta su callback, que
+        # llama a _release, en el mismo hilo.
+        self._lock = threading.RLock()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.backend.get(key)
+        if value is not None:
+            with self._lock:
+                self.stats["hits"] += 1
+        return value
+
+    def _claim(self, key: str):
+        """(valor en caché, None, False), (None, en vuelo, False) o (None, nuevo, True)."""
+        value = self.get(key)
+        if value is not None:
+            return value, None, False
+        with self._lock:
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.stats["coalesced"] += 1
+                inflight.followers += 1
+                return None, inflight, False
+            # Otro hilo pudo terminar y guardar entre la lectura y el lock.
+            value = self.backend.get(key)
+            if value is not None:
+                self.stats["hits"] += 1
+                return value, None, False
+            inflight = InflightText()
+            inflight.followers = 1
+            self._inflight[key] = inflight
+            self.stats["misses"] += 1
+            return None, inflight, True
+
+    def _release(self, key: str, inflight: InflightText, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            if self._inflight.get(key) is inflight:
+                del self._inflight[key]
+        inflight.finish(error)
+
+    def _produce(self, key: str, inflight: InflightText, produce: Callable[[], Iterable[str]]) -> None:
+        try:
+            for chunk in produce():
+                inflight.publish(chunk)
+        except BaseException as exc:
+            self._release(key, inflight, exc)
+            return
+        text = "".join(inflight.chunks)
+        if self.should_cache(text):
+            self.backend.set(key, text)
+        self._release(key, inflight)
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        value, inflight, leader = self._claim(key)
+        if value is not None:
+            return value
+        if leader:
+            self._produce(key, inflight, lambda: [compute()])
+        return inflight.text()
+
+    def stream(
+        self,
+        key: str,
+        produce: Callable[[], Iterable[str]],
+        submit: Callable[..., Future],
+        timeout: Optional[float] = None,
+    ) -> tuple[Iterator[str], Optional[InflightText]]:
+        """
+        (fragmentos, inflight). El productor arranca de inmediato en segundo
+        plano; inflight es el texto en vuelo que este lector sigue (None si
+        ya estaba en caché), para pasarlo a leave. Si la tarea se cancela
+        antes de empezar, los lectores reciben CancelledError. timeout es la
+        espera máxima entre fragmentos.
+        """
+        value, inflight, leader = self._claim(key)
+        if value is not None:
+            return iter([value]), None
+        if leader:
+            try:
+                future = submit(self._produce, key, inflight, produce)
+            except BaseException as exc:
+                self._release(key, inflight, exc)
+                raise
+            with self._lock:
+                inflight.future = future
+            future.add_done_callback(
+                lambda done: done.cancelled() and self._release(key, inflight, CancelledError())
+            )
+        return inflight.follow(timeout), inflight
+
+    def leave(self, key: str, inflight: InflightText) -> None:
+        """
+        Un lector de stream abandona el texto. Si era el último, la tarea se
+        cancela, pero solo si sigue en cola: una llamada que ya empezó no se
+        puede detener y termina (y se guarda) sin lectores.
+        """
+        with self._lock:
+            inflight.followers = max(inflight.followers - 1, 0)
+            if inflight.followers == 0 and inflight.future is not None:
+                inflight.future.cancel()
+
+
+def make_explanation_cache(
+    sqlite_path: Optional[str] = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    should_cache: Callable[[str], bool] = bool,
+) -> ExplanationCache:
+    """Caché en memoria o, si se da sqlite_path, en un archivo SQLite."""
+    if sqlite_path:
+        backend: Any = SQLiteBackend(sqlite_path, max_entries, ttl_seconds)
+    else:
+        backend = MemoryBackend(max_entries, ttl_seconds)
+    return ExplanationCache(backend, should_cache)
@@ -1,6 +1,9 @@
 import json
 import os
-from typing import Any
+import re
+from typing import Any, Iterator, Optional
+
+from llm.providers import ExplanationProvider, GeminiProvider
 
 SYSTEM_PROMPT_EXPLAINER = (
     "Eres un asistente de interpretación de resultados de un modelo de movilidad social. "
@@ -38,6 +41,20 @@ SYSTEM_PROMPT_EXPLAINER = (
 DEFAULT_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-3-flash-preview")
 GENERATION_FALLBACK_MSG = "No se pudo generar explicación, reintenta."
 
+# Presupuesto del contexto enviado al modelo (tokens estimados). Los grupos de
+# resultados se ordenan por incremento y confianza y se recortan los últimos.
+DEFAULT_CONTEXT_TOKEN_BUDGET = int(os.getenv("EXPLANATION_CONTEXT_TOKENS", "1500"))
+CHARS_PER_TOKEN = 4
+CONFIDENCE_RANK = {"baja": 0, "media": 1, "alta": 2, "muy alta": 3}
+MISSING_KEY_MSG = (
+    "No se encontró la clave de Gemini. Configúrala en `st.secrets` "
+    "como `gemini_api_key` o `GEMINI_API_KEY` para habilitar la explicación personalizada."
+)
+MISSING_DEPENDENCY_MSG = (
+    "Falta la dependencia `google-genai`. Instálala con "
+    "`pip install -U google-genai`."
+)
+
 
 def _safe_text(value: Any) -> str:
     if value is None:
@@ -77,93 +94,227 @@ def _format_questionnaire(questionnaire_rows: list[dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def _format_results(groups: list[dict[str, Any]]) -> str:
+def estimate_tokens(text: str) -> int:
+    """Estimación gruesa de tokens: ~CHARS_PER_TOKEN caracteres por token."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _increment_value(scenario: dict[str, Any]) -> float:
+    text = str(((scenario.get("summary") or {}).get("incremento") or {}).get("text", ""))
+    match = re.search(r"[-+]?\d+(?:\.\d+)?", text)
+    return float(match.group()) if match else float("-inf")
+
+
+def _confidence_rank(scenario: dict[str, Any]) -> int:
+    confianza = str((scenario.get("summary") or {}).get("confianza", "")).strip().lower()
+    return CONFIDENCE_RANK.get(confianza, -1)
+
+
+def _scenario_score(scenario: dict[str, Any]) -> tuple[float, int]:
+    return _increment_value(scenario), _confidence_rank(scenario)
+
+
+def _group_score(group: dict[str, Any]) -> tuple[float, int]:
+    """Mejor escenario del grupo: primero incremento y luego confianza."""
+    return max((_scenario_score(sc) for sc in group.get("scenarios", [])), default=(float("-inf"), -1))
+
+
+def _format_group(idx: int, group: dict[str, Any], seen_variables: set) -> str:
+    """
+    Bloque de un grupo. El detalle de cambio (¿puedo cambiarlo?, involucrados,
+    recursos) de una variable solo se escribe la primera vez que aparece;
+    seen_variables se actualiza con las variables escritas.
+    """
+    group_lines = [f"- Grupo #{idx}", "  - Variables clave:"]
+    variables = group.get("variables", [])
+    if not variables:
+        group_lines.append("    - no disponible")
+    for var in variables:
+        descripcion = _safe_text(var.get("descripcion"))
+        categorias = _safe_text(var.get("categorias"))
+        if descripcion in seen_variables:
+            group_lines.append(f"    - {descripcion}: {categorias} (detalle arriba)")
+            continue
+        seen_variables.add(descripcion)
+        cambio_yo = _safe_text(var.get("change_level"))
+        involucrados = _safe_text(var.get("involucrados"))
+        recursos = _safe_text(var.get("recursos"))
+        group_lines.append(f"    - {descripcion}: {categorias}")
+        group_lines.append(f"      - ¿Puedo cambiarlo yo?: {cambio_yo}")
+        group_lines.append(f"      - Involucrados: {involucrados}")
+        group_lines.append(f"      - Recursos: {recursos}")
+
+    group_lines.append("  - Escenarios asociados:")
+    scenarios = sorted(group.get("scenarios", []), key=_scenario_score, reverse=True)
+    if not scenarios:
+        group_lines.append("    - no disponible")
+
+    for scenario in scenarios:
+        summary = scenario.get("summary", {})
+        group_lines.append(
+            "    - "
+            f"Escenario { _safe_text(scenario.get('nombre')) }: "
+            f"incremento={_safe_text((summary.get('incremento') or {}).get('text'))}, "
+            f"probabilidad={_safe_text(summary.get('probabilidad'))}, "
+            f"Confianza={_safe_text(summary.get('confianza'))}, "
+            f"Obs={_safe_text(summary.get('obs'))}"
+        )
+    return "\n".join(group_lines)
+
+
+def _format_results(groups: list[dict[str, Any]], token_budget: Optional[int] = None) -> tuple[str, int]:
+    """
+    (texto, grupos incluidos). Los grupos van del mayor al menor incremento
+    (y confianza) y se agregan mientras quepan en token_budget; el primero
+    siempre entra. Cada grupo conserva su número de tarjeta.
+    """
     if not groups:
-        return "- No hubo resultados del modelo para explicar."
+        return "- No hubo resultados del modelo para explicar.", 0
 
+    ranked = sorted(enumerate(groups, start=1), key=lambda item: _group_score(item[1]), reverse=True)
+    omitted_note = "- Se omitieron {} grupos con menor incremento/confianza por límite de contexto."
+    # Espacio para la nota de omitidos mientras queden grupos por agregar.
+    note_tokens = estimate_tokens(omitted_note.format(len(groups))) + 1
     rendered_groups = []
-    for idx, group in enumerate(groups, start=1):
-        group_lines = [f"- Grupo #{idx}", "  - Variables clave:"]
-        variables = group.get("variables", [])
-        if not variables:
-            group_lines.append("    - no disponible")
-        for var in variables:
-            descripcion = _safe_text(var.get("descripcion"))
-            categorias = _safe_text(var.get("categorias"))
-            cambio_yo = _safe_text(var.get("change_level"))
-            involucrados = _safe_text(var.get("involucrados"))
-            recursos = _safe_text(var.get("recursos"))
-            group_lines.append(f"    - {descripcion}: {categorias}")
-            group_lines.append(f"      - ¿Puedo cambiarlo yo?: {cambio_yo}")
-            group_lines.append(f"      - Involucrados: {involucrados}")
-            group_lines.append(f"      - Recursos: {recursos}")
-
-        group_lines.append("  - Escenarios asociados:")
-        scenarios = group.get("scenarios", [])
-        if not scenarios:
-            group_lines.append("    - no disponible")
-
-        for scenario in scenarios:
-            summary = scenario.get("summary", {})
-            group_lines.append(
-                "    - "
-                f"Escenario { _safe_text(scenario.get('nombre')) }: "
-                f"incremento={_safe_text((summary.get('incremento') or {}).get('text'))}, "
-                f"probabilidad={_safe_text(summary.get('probabilidad'))}, "
-                f"Confianza={_safe_text(summary.get('confianza'))}, "
-                f"Obs={_safe_text(summary.get('obs'))}"
-            )
-        rendered_groups.append("\n".join(group_lines))
-
-    return "\n\n".join(rendered_groups)
-
-
-def build_context_text(app_state: dict[str, Any]) -> str:
+    seen_variables: set = set()
+    used_tokens = 0
+    for pos, (idx, group) in enumerate(ranked, start=1):
+        candidate_seen = set(seen_variables)
+        block = _format_group(idx, group, candidate_seen)
+        block_tokens = estimate_tokens(block) + 1
+        reserve = note_tokens if pos < len(ranked) else 0
+        if rendered_groups and token_budget is not None and used_tokens + block_tokens + reserve > token_budget:
+            break
+        rendered_groups.append(block)
+        seen_variables = candidate_seen
+        used_tokens += block_tokens
+
+    omitted = len(groups) - len(rendered_groups)
+    if omitted:
+        rendered_groups.append(omitted_note.format(omitted))
+    return "\n\n".join(rendered_groups), len(rendered_groups) - (1 if omitted else 0)
+
+
+def build_context(app_state: dict[str, Any], token_budget: Optional[int] = DEFAULT_CONTEXT_TOKEN_BUDGET) -> dict[str, Any]:
+    """
+    Contexto para el modelo con presupuesto de tokens. El target, los filtros y
+    el cuestionario siempre van; los resultados usan lo que quede del
+    presupuesto (token_budget=None no recorta). Devuelve el texto, su
+    estimación de tokens y cuántos grupos entraron.
+    """
     target = _safe_text(app_state.get("target_label") or app_state.get("target"))
-    return (
+    head = (
         f"### TARGET\n- {target}\n\n"
         f"### FILTROS\n{_format_filters(app_state.get('active_filters', []))}\n\n"
         f"### CUESTIONARIO (INPUT)\n{_format_questionnaire(app_state.get('questionnaire', []))}\n\n"
-        f"### RESULTADOS (OUTPUT)\n{_format_results(app_state.get('results', []))}"
+        "### RESULTADOS (OUTPUT)\n"
     )
+    results_budget = None if token_budget is None else max(token_budget - estimate_tokens(head), 0)
+    groups = app_state.get("results", [])
+    results_text, groups_included = _format_results(groups, results_budget)
+    text = head + results_text
+    return {
+        "text": text,
+        "tokens": estimate_tokens(text),
+        "groups_total": len(groups),
+        "groups_included": groups_included,
+    }
+
 
+def build_context_text(app_state: dict[str, Any], token_budget: Optional[int] = DEFAULT_CONTEXT_TOKEN_BUDGET) -> str:
+    return build_context(app_state, token_budget)["text"]
+
+
+def is_cacheable_explanation(text: str) -> bool:
+    """Las explicaciones reales se guardan en caché; los mensajes de error no."""
+    return bool(text) and not text.endswith(GENERATION_FALLBACK_MSG) and text not in (
+        MISSING_KEY_MSG,
+        MISSING_DEPENDENCY_MSG,
+    )
 
-def generate_explanation(app_state: dict[str, Any]) -> str:
-    gemini_api_key = (
+
+def resolve_api_key(app_state: dict[str, Any]) -> str:
+    return (
         app_state.get("gemini_api_key")
         or os.getenv("GEMINI_API_KEY")
         or os.getenv("gemini_api_key")
+        or ""
     )
-    if not gemini_api_key:
-        return (
-            "No se encontró la clave de Gemini. Configúrala en `st.secrets` "
-            "como `gemini_api_key` o `GEMINI_API_KEY` para habilitar la explicación personalizada."
-        )
 
+
+def _resolve_provider(app_state: dict[str, Any], provider: Optional[ExplanationProvider]):
+    """
+    (proveedor, None) o (None, mensaje para el usuario). Sin proveedor
+    inyectado se crea un cliente de Gemini solo para esta llamada.
+    """
+    if provider is not None:
+        return provider, None
+    gemini_api_key = resolve_api_key(app_state)
+    if not gemini_api_key:
+        return None, MISSING_KEY_MSG
     try:
-        from google import genai
-        from google.genai import types
+        return GeminiProvider(gemini_api_key), None
+    except ImportError:
+        return None, MISSING_DEPENDENCY_MSG
     except Exception:
-        return (
-            "Falta la dependencia `google-genai`. Instálala con "
-            "`pip install -U google-genai`."
-        )
+        return None, GENERATION_FALLBACK_MSG
+
 
-    context_text = build_context_text(app_state)
+def generate_explanation(
+    app_state: dict[str, Any],
+    context_text: Optional[str] = None,
+    provider: Optional[ExplanationProvider] = None,
+) -> str:
+    provider, message = _resolve_provider(app_state, provider)
+    if message is not None:
+        return message
+
+    if context_text is None:
+        context_text = build_context_text(app_state)
 
     try:
-        os.environ["GEMINI_API_KEY"] = gemini_api_key
-        client = genai.Client()
-        response = client.models.generate_content(
-            model=app_state.get("model_name", DEFAULT_MODEL_NAME),
-            contents=context_text,
-            config=types.GenerateContentConfig(
-                system_instruction=SYSTEM_PROMPT_EXPLAINER,
-            ),
+        text = provider.generate(
+            app_state.get("model_name", DEFAULT_MODEL_NAME),
+            SYSTEM_PROMPT_EXPLAINER,
+            context_text,
         )
-        text = getattr(response, "text", None)
         if text:
             return text
         return GENERATION_FALLBACK_MSG
     except Exception:
         return GENERATION_FALLBACK_MSG
+
+
+def stream_explanation(
+    app_state: dict[str, Any],
+    context_text: Optional[str] = None,
+    provider: Optional[ExplanationProvider] = None,
+) -> Iterator[str]:
+    """
+    Versión en streaming de generate_explanation: produce los fragmentos de
+    texto conforme llegan. Los errores no se lanzan: se producen como texto
+    (GENERATION_FALLBACK_MSG al final si el stream se corta).
+    """
+    provider, message = _resolve_provider(app_state, provider)
+    if message is not None:
+        yield message
+        return
+
+    if context_text is None:
+        context_text = build_context_text(app_state)
+
+    produced = False
+    try:
+        for chunk in provider.stream(
+            app_state.get("model_name", DEFAULT_MODEL_NAME),
+            SYSTEM_PROMPT_EXPLAINER,
+            context_text,
+        ):
+            if chunk:
+                produced = True
+                yield chunk
+    except Exception:
+        yield f"\n\n{GENERATION_FALLBACK_MSG}" if produced else GENERATION_FALLBACK_MSG
+        return
+    if not produced:
+        yield GENERATION_FALLBACK_MSG
@@ -0,0 +1,109 @@
+import time
+from typing import Iterator, Optional, Protocol
+
+# Proveedores de texto para el explicador. Todos exponen la misma interfaz:
+# - generate(model, system_instruction, contents) -> str
+# - stream(model, system_instruction, contents) -> iterador de fragmentos
+# GeminiProvider usa la API de Gemini; FakeProvider responde en el mismo
+# proceso, sin red, para probar la app, el streaming y los reintentos
+# localmente (EXPLANATION_PROVIDER=fake, ver llm/client_pool.py).
+
+FAKE_EXPLANATION_TEXT = (
+    "1) Diagnóstico\n"
+    "- Explicación de prueba generada sin conexión al modelo.\n"
+    "- El contexto recibido tiene {n_chars} caracteres.\n\n"
+    "2) Top 3 acciones priorizadas\n"
+    "- Acción de ejemplo 1.\n- Acción de ejemplo 2.\n- Acción de ejemplo 3.\n\n"
+    "3) Plan por horizonte\n"
+    "- 7 días / 30–90 días / 6–12 meses.\n\n"
+    "4) Riesgos y límites\n"
+    "- Texto ficticio: no interpretar."
+)
+
+
+class ExplanationProvider(Protocol):
+    def generate(self, model: str, system_instruction: str, contents: str) -> str:
+        ...
+
+    def stream(self, model: str, system_instruction: str, contents: str) -> Iterator[str]:
+        ...
+
+
+class GeminiProvider:
+    """Cliente de google-genai. Lanza ImportError si falta la dependencia."""
+
+    def __init__(self, api_key: str, timeout_seconds: Optional[float] = None):
+        from google import genai
+        from google.genai import types
+
+        self._types = types
+        http_options = None
+        if timeout_seconds is not None:
+            http_options = types.HttpOptions(timeout=int(timeout_seconds * 1000))
+        self.client = genai.Client(api_key=api_key, http_options=http_options)
+
+    def _config(self, system_instruction: str):
+        return self._types.GenerateContentConfig(system_instruction=system_instruction)
+
+    def generate(self, model: str, system_instruction: str, contents: str) -> str:
+        response = self.client.models.generate_content(
+            model=model,
+            contents=contents,
+            config=self._config(system_instruction),
+        )
+        return getattr(response, "text", None) or ""
+
+    def stream(self, model: str, system_instruction: str, contents: str) -> Iterator[str]:
+        for chunk in self.client.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=self._config(system_instruction),
+        ):
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
+
+
+class FakeProvider:
+    """
+    Proveedor local para pruebas: devuelve `text` (por defecto un texto fijo
+    con el tamaño del contexto) en fragmentos de chunk_size caracteres, con
+    first_token_delay y chunk_delay segundos de espera. Si se da `error`, lo
+    lanza después de fail_after fragmentos.
+    """
+
+    def __init__(
+        self,
+        text: Optional[str] = None,
+        chunk_size: int = 24,
+        first_token_delay: float = 0.0,
+        chunk_delay: float = 0.0,
+        error: Optional[Exception] = None,
+        fail_after: int = 0,
+    ):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.first_token_delay = first_token_delay
+        self.chunk_delay = chunk_delay
+        self.error = error
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def _text(self, contents: str) -> str:
+        return self.text if self.text is not None else FAKE_EXPLANATION_TEXT.format(n_chars=len(contents))
+
+    def generate(self, model: str, system_instruction: str, contents: str) -> str:
+        return "".join(self.stream(model, system_instruction, contents))
+
+    def stream(self, model: str, system_instruction: str, contents: str) -> Iterator[str]:
+        self.calls += 1
+        text = self._text(contents)
+        time.sleep(self.first_token_delay)
+        for pos, start in enumerate(range(0, len(text), self.chunk_size)):
+            if self.error is not None and pos >= self.fail_after:
+                raise self.error
+            if pos:
+                time.sleep(self.chunk_delay)
+            yield text[start : start + self.chunk_size]
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,161 @@
+import os
+import threading
+import time
+from collections.abc import Mapping
+
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.lazy import LazyAssets
+
+# Registro de modelos y artefactos pesados compartido por todo el proceso.
+# Cada entrada se carga una sola vez, en el primer get_model que la pida
+# (carga perezosa), con un lock por entrada para que dos sesiones simultáneas
+# no la carguen dos veces. El registro guarda el tiempo de carga y el tamaño
+# en disco y en memoria de cada entrada (ver model_report).
+#
+# Los objetos devueltos se comparten entre sesiones: son de solo lectura.
+
+# joblib.load(..., mmap_mode="r") deja los arreglos numpy del pickle en un
+# memory map de solo lectura, compartido entre procesos del mismo host.
+# (Los árboles de scikit-learn copian sus arreglos al reconstruirse, así que
+# en ese caso solo se evita la copia intermedia.) None lo desactiva.
+JOBLIB_MMAP_MODE = "r"
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_registry():
+    """Estado del registro: {"lock": Lock, "entries": {nombre: entrada}}."""
+    return {"lock": threading.Lock(), "entries": {}}
+
+
+def load_joblib(path, mmap_mode=JOBLIB_MMAP_MODE):
+    return joblib.load(path, mmap_mode=mmap_mode)
+
+
+def _entry(name, loader, path):
+    registry = get_model_registry()
+    with registry["lock"]:
+        entry = registry["entries"].get(name)
+        if entry is None:
+            entry = {
+                "lock": threading.Lock(),
+                "loader": loader,
+                "path": path,
+                "model": None,
+                "loaded": False,
+                "seconds": None,
+            }
+            registry["entries"][name] = entry
+    return entry
+
+
+def get_model(name, loader, path=None):
+    """
+    Devuelve el objeto registrado como `name`, cargándolo con loader() la
+    primera vez. path (opcional) es el archivo de origen, solo para el reporte.
+    """
+    entry = _entry(name, loader, path)
+    if not entry["loaded"]:
+        with entry["lock"]:
+            if not entry["loaded"]:
+                start = time.perf_counter()
+                model = entry["loader"]()
+                entry["seconds"] = time.perf_counter() - start
+                entry["model"] = model
+                entry["loaded"] = True
+    return entry["model"]
+
+
+def estimate_nbytes(obj, _seen=None, _depth=0):
+    """
+    Tamaño aproximado en memoria: suma arreglos numpy, DataFrames/Series y
+    recorre dicts, listas y atributos de objetos (p. ej. estimadores de
+    scikit-learn y sus árboles). Los memory maps no cuentan y de un
+    LazyAssets solo se cuentan los artefactos ya cargados.
+    """
+    _seen = set() if _seen is None else _seen
+    if id(obj) in _seen or _depth > 8:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.memmap):
+        return 0
+    if isinstance(obj, np.ndarray):
+        return 0 if isinstance(obj.base, np.memmap) else obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return 0
+    if type(obj).__name__ == "Tree":
+        # Árbol de scikit-learn: sus arreglos solo se ven vía __getstate__ (copias
+        # temporales, por eso se suman aquí y no pasan por _seen).
+        return sum(
+            value.nbytes for value in obj.__getstate__().values() if isinstance(value, np.ndarray)
+        )
+    if isinstance(obj, LazyAssets):
+        items = obj.loaded().values()
+    elif isinstance(obj, Mapping):
+        items = obj.values()
+    elif isinstance(obj, (list, tuple, set)):
+        items = obj
+    elif hasattr(obj, "__dict__"):
+        items = vars(obj).values()
+    else:
+        return 0
+    return sum(estimate_nbytes(item, _seen, _depth + 1) for item in items)
+
+
+def _disk_bytes(path):
+    if os.path.isdir(path):
+        return sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(path)
+            for name in files
+        )
+    return os.path.getsize(path)
+
+
+def model_report():
+    """
+    Una fila por entrada registrada: estado, tiempo de carga y tamaños. La
+    memoria se estima al pedir el reporte (las entradas perezosas crecen).
+    """
+    rows = []
+    for name, entry in list(get_model_registry()["entries"].items()):
+        path = entry["path"]
+        memory_bytes = estimate_nbytes(entry["model"]) if entry["loaded"] else None
+        rows.append(
+            {
+                "model": name,
+                "loaded": entry["loaded"],
+                "load_seconds": entry["seconds"],
+                "memory_mb": None if memory_bytes is None else memory_bytes / 1024**2,
+                "file_mb": _disk_bytes(path) / 1024**2 if path and os.path.exists(path) else None,
+                "path": path,
+            }
+        )
+    return pd.DataFrame(
+        rows, columns=["model", "loaded", "load_seconds", "memory_mb", "file_mb", "path"]
+    )
+
+
+def main():
+    """python model_registry.py: carga los modelos de la app y muestra el reporte."""
+    # Se importa el módulo por nombre: al correr como script, __main__ es
+    # otra copia con su propio registro.
+    import model_registry
+    from section3 import load_section3_model
+    from section4 import load_knn_indexes, load_section4_assets
+
+    load_section3_model()
+    assets = load_section4_assets()
+    for key in assets:
+        assets[key]
+    load_knn_indexes()
+    print(model_registry.model_report().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
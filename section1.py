@@ -8,6 +8,7 @@ from plotly.subplots import make_subplots
 
 from data_utils import load_and_process_data
 from config import VAR_CATEGORIES, POSSIBLE_VARS
+from utils.intervalos import wilson_ci
 
 SMALL_SAMPLE_THRESHOLD = 30
 
@@ -63,20 +64,20 @@ def show_section1():
             default=st.session_state[f"cats_{var}"]
         )
 
-    # 2) Cargar datos
-    df = load_and_process_data()
+    # 2) Cargar el cubo de conteos (se construye una sola vez por proceso)
+    cube = load_mobility_cube()
 
     # 3) Filtro principal
-    df_filter = apply_dynamic_filter(df)
+    filter_counts = cube_transition_counts(cube, get_filter_selection())
 
     # 4) Checkbox "Cambiar base"
     st.sidebar.markdown("---")
     cambiar_base = st.sidebar.checkbox("Cambiar base", value=False)
     if cambiar_base:
-        show_base_filters(df)
-        df_base = st.session_state.get('df_base', df)
+        base_selection = show_base_filters()
+        base_counts = cube_transition_counts(cube, base_selection)
     else:
-        df_base = df
+        base_counts = cube_transition_counts(cube, {})
 
     # 5) Construir el título a partir de los filtros
     filter_desc = describe_filter_selection(st.session_state['selected_vars'], prefix="Filtro: ")
@@ -87,7 +88,7 @@ def show_section1():
         main_title = filter_desc or "Sin Filtro (Base General)"
 
     # 6) Plot interactivo con Plotly
-    fig, sample_sizes = plot_mobility_interactive(df_filter, df_base)
+    fig, sample_sizes = plot_mobility_interactive(filter_counts, base_counts)
 
     # Colocamos el título principal arriba de la figura
     # st.markdown("## Movilidad Socioeconómica Q1 vs Q5")
@@ -133,15 +134,20 @@ def show_section1():
             unsafe_allow_html=True
         )
 
-def apply_dynamic_filter(df):
-    dff = df.copy()
-    for var in st.session_state['selected_vars']:
-        chosen_cats = st.session_state.get(f"cats_{var}", [])
+def get_filter_selection(vars_key='selected_vars', cats_prefix='cats_'):
+    """
+    Lee de session_state la selección de filtros como {variable: [categorías]}.
+    Las variables seleccionadas sin categorías no filtran y se omiten.
+    """
+    selection = {}
+    for var in st.session_state.get(vars_key, []):
+        chosen_cats = st.session_state.get(f"{cats_prefix}{var}", [])
         if chosen_cats:
-            dff = dff[dff[var].isin(chosen_cats)]
-    return dff
+            selection[var] = list(chosen_cats)
+    return selection
 
-def show_base_filters(df):
+def show_base_filters():
+    """Dibuja los filtros de la base personalizada y devuelve su selección."""
     if 'base_selected_vars' not in st.session_state:
         st.session_state['base_selected_vars'] = []
     for var in POSSIBLE_VARS:
@@ -164,12 +170,61 @@ def show_base_filters(df):
             default=st.session_state[f"base_cats_{var}"]
         )
 
-    dff = df.copy()
-    for var in st.session_state['base_selected_vars']:
-        chosen_cats = st.session_state.get(f"base_cats_{var}", [])
-        if chosen_cats:
-            dff = dff[dff[var].isin(chosen_cats)]
-    st.session_state['df_base'] = dff
+    return get_filter_selection('base_selected_vars', 'base_cats_')
+
+def build_mobility_cube(df):
+    """
+    Cubo de conteos indexado por (generation, sex, education,
+    a_los_14_quintile, actualmente_quintile), en el orden de POSSIBLE_VARS.
+
+    Cada eje de filtro tiene las categorías de VAR_CATEGORIES más un último
+    casillero "otro" (categorías fuera del catálogo y faltantes), que sólo
+    cuenta cuando la variable no se filtra. El eje de origen tiene los
+    quintiles 1..5 y el de destino 1..5 más un casillero para faltantes.
+    Las filas sin quintil de origen no participan en ninguna distribución.
+    """
+    shape = [len(VAR_CATEGORIES[var]) + 1 for var in POSSIBLE_VARS] + [5, 6]
+
+    origin = df['a_los_14_quintile'].to_numpy(dtype='float64')
+    dest = df['actualmente_quintile'].to_numpy(dtype='float64')
+    valid = np.isin(origin, [1, 2, 3, 4, 5])
+
+    codes = []
+    for var, size in zip(POSSIBLE_VARS, shape):
+        var_codes = pd.Categorical(df[var], categories=VAR_CATEGORIES[var]).codes.astype('int64')
+        var_codes[var_codes < 0] = size - 1
+        codes.append(var_codes[valid])
+    codes.append(origin[valid].astype('int64') - 1)
+    dest_codes = np.full(valid.sum(), 5, dtype='int64')
+    dest_valid = np.isin(dest[valid], [1, 2, 3, 4, 5])
+    dest_codes[dest_valid] = dest[valid][dest_valid].astype('int64') - 1
+    codes.append(dest_codes)
+
+    flat = np.ravel_multi_index(codes, shape)
+    counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+    return {'vars': list(POSSIBLE_VARS), 'counts': counts}
+
+@st.cache_resource(show_spinner=False)
+def load_mobility_cube():
+    """Cubo de movilidad construido una vez por proceso a partir del frame compartido."""
+    return build_mobility_cube(load_and_process_data())
+
+def cube_transition_counts(cube, selection):
+    """
+    Suma las rebanadas del cubo que cumplen selection ({variable: [categorías]}:
+    OR dentro de una variable, AND entre variables) y devuelve la matriz 5x6
+    de conteos origen x destino (la última columna son destinos faltantes).
+    """
+    counts = cube['counts']
+    for var in cube['vars']:
+        chosen = selection.get(var)
+        if chosen:
+            levels = VAR_CATEGORIES[var]
+            mask = np.array([level in chosen for level in levels] + [False])
+            counts = counts[mask].sum(axis=0)
+        else:
+            counts = counts.sum(axis=0)
+    return counts
 
 def describe_filter_selection(selected_vars, prefix="", base=False):
     parts = []
@@ -184,48 +239,50 @@ def describe_filter_selection(selected_vars, prefix="", base=False):
     else:
         return prefix + "(Sin selección)"
 
-def wilson_ci(successes, n, z=1.96):
-    if n <= 0:
-        return 0.0, 0.0
-    p = successes / n
-    denom = 1 + z**2 / n
-    center = (p + z**2 / (2 * n)) / denom
-    margin = (
-        z
-        * np.sqrt((p * (1 - p) / n) + (z**2 / (4 * n**2)))
-        / denom
-    )
-    lower = max(0.0, center - margin)
-    upper = min(1.0, center + margin)
-    return lower * 100, upper * 100
-
+def error_bars(counts_row, dist, keys, n):
+    """
+    Barras de error (Wilson) para los destinos keys de un origen, calculadas en
+    una sola llamada vectorizada. Devuelve (err_plus, err_minus) en puntos %.
+    """
+    keys = np.asarray(keys, dtype='int64')
+    vals = np.array([dist.get(k, 0) for k in keys], dtype='float64')
+    low, up = wilson_ci(counts_row[keys - 1], n)
+    return np.maximum(0, up - vals).tolist(), np.maximum(0, vals - low).tolist()
 
-def plot_mobility_interactive(df_filter, df_base):
+def destination_distribution(counts, origin_quintile):
+    """
+    Distribución (%) de quintiles de destino para un quintil de origen, a partir
+    de la matriz de cube_transition_counts. Igual que value_counts(normalize=True)
+    sólo incluye destinos observados y excluye destinos faltantes.
+    Devuelve (serie indexada por quintil, n de origen incluyendo faltantes).
+    """
+    row = counts[origin_quintile - 1]
+    observed = row[:5]
+    total = observed.sum()
+    n_origin = int(row.sum())
+    if total == 0:
+        return pd.Series(dtype='float64'), n_origin
+    present = np.flatnonzero(observed)
+    dist = pd.Series(observed[present] / total * 100, index=present + 1)
+    return dist, n_origin
+
+def plot_mobility_interactive(filter_counts, base_counts):
     """
     Crea 2 subplots: Origen Clase Baja (Q1) y Origen Clase Alta (Q5),
     con barra "Base" y "Filtro". Se usan anotaciones personalizadas para
     que la diferencia sea roja (si <0) o verde (si >0). Se mantiene la
     misma escala en ambos y en Q5 se oculta el eje Y.
     Además, se deja ~10% de margen vertical extra para no recortar etiquetas.
+    Recibe las matrices origen x destino de cube_transition_counts.
     """
 
     # Cálculo: Q1 base/filtro
-    q1_base = df_base[df_base['a_los_14_quintile'] == 1]
-    q1_dist_base = q1_base['actualmente_quintile'].value_counts(normalize=True)*100
-    q1_dist_base = q1_dist_base.sort_index()
-
-    q1_filter = df_filter[df_filter['a_los_14_quintile'] == 1]
-    q1_dist_filter = q1_filter['actualmente_quintile'].value_counts(normalize=True)*100
-    q1_dist_filter = q1_dist_filter.sort_index()
+    q1_dist_base, _ = destination_distribution(base_counts, 1)
+    q1_dist_filter, q1_filter_n = destination_distribution(filter_counts, 1)
 
     # Cálculo: Q5 base/filtro
-    q5_base = df_base[df_base['a_los_14_quintile'] == 5]
-    q5_dist_base = q5_base['actualmente_quintile'].value_counts(normalize=True)*100
-    q5_dist_base = q5_dist_base.sort_index()
-
-    q5_filter = df_filter[df_filter['a_los_14_quintile'] == 5]
-    q5_dist_filter = q5_filter['actualmente_quintile'].value_counts(normalize=True)*100
-    q5_dist_filter = q5_dist_filter.sort_index()
+    q5_dist_base, _ = destination_distribution(base_counts, 5)
+    q5_dist_filter, q5_filter_n = destination_distribution(filter_counts, 5)
 
     quintil_labels = {
         1: "Baja Baja",
@@ -238,24 +295,8 @@ def plot_mobility_interactive(df_filter, df_base):
     x_q1 = list(q1_dist_base.index.union(q1_dist_filter.index))
     x_q5 = list(q5_dist_base.index.union(q5_dist_filter.index))
 
-    q1_filter_n = len(q1_filter)
-    q5_filter_n = len(q5_filter)
-
-    q1_err_plus, q1_err_minus = [], []
-    for k in x_q1:
-        successes = int((q1_filter['actualmente_quintile'] == k).sum())
-        val = q1_dist_filter.get(k, 0)
-        low, up = wilson_ci(successes, q1_filter_n)
-        q1_err_plus.append(max(0, up - val))
-        q1_err_minus.append(max(0, val - low))
-
-    q5_err_plus, q5_err_minus = [], []
-    for k in x_q5:
-        successes = int((q5_filter['actualmente_quintile'] == k).sum())
-        val = q5_dist_filter.get(k, 0)
-        low, up = wilson_ci(successes, q5_filter_n)
-        q5_err_plus.append(max(0, up - val))
-        q5_err_minus.append(max(0, val - low))
+    q1_err_plus, q1_err_minus = error_bars(filter_counts[0], q1_dist_filter, x_q1, q1_filter_n)
+    q5_err_plus, q5_err_minus = error_bars(filter_counts[4], q5_dist_filter, x_q5, q5_filter_n)
 
     fig = make_subplots(rows=1, cols=2, shared_yaxes=True,
                         subplot_titles=("Origen Clase Baja", "Origen Clase Alta"))
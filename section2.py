@@ -5,7 +5,9 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 
-from data_utils import load_and_process_data
+from config import POSSIBLE_VARS
+from data_utils import filter_mask, load_and_process_data, load_filter_index
+from utils.intervalos import wilson_ci
 
 # Diccionario para mapear clases a quintiles
 CLASS_TO_QUINTILES = {
@@ -40,14 +42,16 @@ def show_section2():
     Evolución Temporal (Sección 2)
     Aplica los filtros de la barra lateral excepto 'generation'.
     """
-    # 1) Cargar y procesar datos
-    df = load_and_process_data()
-    df = add_cohort_5y_column(df, step=3)
-
-    # 2) Filtro excepto generation
-    df_filtered = apply_filter_except_generation(df)
+    # 1) Filtro excepto generation y tensor de transiciones (cacheado por filtro)
+    cohort_step = 3
+    selection = filter_selection_except_generation()
+    tensor = load_transition_tensor(
+        tuple(selection.keys()),
+        tuple((var, tuple(cats)) for var, cats in selection.items()),
+        step=cohort_step,
+    )
 
-    # 3) Controles Origen y Destino (multiselect)
+    # 2) Controles Origen y Destino (multiselect)
     #    Con valores por defecto si no existen en session_state
     if "origin_default" not in st.session_state:
         st.session_state["origin_default"] = ["Media Alta"]
@@ -74,10 +78,7 @@ def show_section2():
     st.session_state["origin_default"] = origin_multisel
     st.session_state["dest_default"]   = dest_multisel
 
-    # 4) Armamos el "group_label" para color (multilíneas si hay más filtros)
-    color_column = create_label_column(df_filtered)
-
-    # 5) Filtramos quienes estaban en 'Origen'
+    # 3) Quintiles de origen y destino seleccionados
     origin_quintiles = set()
     for cls in origin_multisel:
         origin_quintiles.update(CLASS_TO_QUINTILES[cls])
@@ -85,33 +86,25 @@ def show_section2():
     for cls in dest_multisel:
         dest_quintiles.update(CLASS_TO_QUINTILES[cls])
 
-    df_filtered['in_origin'] = df_filtered['a_los_14_quintile'].isin(origin_quintiles)
-    df_filtered['in_dest']   = df_filtered['actualmente_quintile'].isin(dest_quintiles)
-
-    df_origin = df_filtered[df_filtered['in_origin'] == True].copy()
-
-    # 6) Group by cohorte + color_column
-    grouped = df_origin.groupby(['cohort_5y', color_column], dropna=False)
-    n_origin = grouped.size().rename("n_origin")
-    n_dest   = grouped['in_dest'].sum().rename("n_dest")
-
-    df_stats = pd.concat([n_origin, n_dest], axis=1).reset_index()
+    # 4) n de origen y de destino por cohorte y grupo: rebanada del tensor
+    df_stats = transition_stats(tensor, origin_quintiles, dest_quintiles)
+    color_column = 'group_label'
+    total_n = int(df_stats['n_origin'].sum())
     df_stats['pct_dest'] = (df_stats['n_dest'] / df_stats['n_origin']) * 100
-    ci_bounds = df_stats.apply(
-        lambda row: wilson_ci(row['n_dest'], row['n_origin']),
-        axis=1,
-        result_type='expand'
+    df_stats['ci_low'], df_stats['ci_high'] = wilson_ci(
+        df_stats['n_dest'].to_numpy(), df_stats['n_origin'].to_numpy()
     )
-    df_stats[['ci_low', 'ci_high']] = ci_bounds
     df_stats['err_plus'] = df_stats['ci_high'] - df_stats['pct_dest']
     df_stats['err_minus'] = df_stats['pct_dest'] - df_stats['ci_low']
 
-    # Convertir cohort_5y a valor numérico
-    df_stats['cohort_start'] = df_stats['cohort_5y'].apply(get_lower_year)
+    # Ordenar por cohorte y descartar edades faltantes; la etiqueta de texto
+    # de la cohorte sólo se arma aquí, sobre la tabla agregada, para mostrarla.
     df_stats.sort_values('cohort_start', inplace=True)
     df_stats.dropna(subset=['cohort_start'], inplace=True)
+    df_stats['cohort_start'] = df_stats['cohort_start'].astype('int64')
+    df_stats['cohort_5y'] = cohort_labels(df_stats['cohort_start'], step=cohort_step)
 
-    # 7) Gráfica
+    # 5) Gráfica
     if not origin_multisel:
         origin_multisel = ["(Ninguno)"]
     if not dest_multisel:
@@ -122,7 +115,6 @@ def show_section2():
     chart_title = f"Porcentaje de {origin_str} que se mueven a {dest_str}"
 
     min_n = int(df_stats['n_origin'].min()) if not df_stats.empty else 0
-    total_n = int(len(df_origin))
     st.caption(f"Tamaño de muestra total (origen filtrado): n={total_n} | mínimo por cohorte-grupo: n={min_n}")
     if min_n < SMALL_SAMPLE_THRESHOLD:
         st.warning("⚠️ Muestra chica en algunos puntos de la serie temporal. Interpretar con cautela.")
@@ -134,8 +126,10 @@ def show_section2():
         color=color_column,
         markers=True,
         title=chart_title,
+        hover_data={'cohort_5y': True},
         labels={
             'cohort_start': "Año de nacimiento",
+            'cohort_5y': "Cohorte",
             'pct_dest': "Probabilidad de cambio",
             color_column: "Categoría"
         }
@@ -163,7 +157,7 @@ def show_section2():
 
     st.plotly_chart(fig, use_container_width=True)
 
-    # 8) Logos finales
+    # 6) Logos finales
     st.markdown("---")
     c1, c2 = st.columns([0.5, 0.5])
     with c1:
@@ -190,66 +184,117 @@ def show_section2():
         )
 
 def add_cohort_5y_column(df, base_year=2017, step=3):
-    def assign_cohort_5y(age):
-        if pd.isna(age):
-            return "NA"
-        birth_year = base_year - int(age)
-        lower_bound = (birth_year // step) * step
-        upper_bound = lower_bound + (step - 1)
-        return f"{lower_bound}-{upper_bound}"
-    df['cohort_5y'] = df['p05h'].apply(assign_cohort_5y)
-    return df
-
-def get_lower_year(cohort_str):
-    if cohort_str == "NA" or pd.isna(cohort_str):
-        return None
-    return int(cohort_str.split('-')[0])
-
-def apply_filter_except_generation(df):
-    if 'selected_vars' not in st.session_state:
-        return df
-    dff = df.copy()
-    for var in st.session_state['selected_vars']:
+    """
+    Devuelve un DataFrame nuevo con 'cohort_start': año inicial de la cohorte
+    de nacimiento ((base_year - edad) // step * step, NaN si falta la edad),
+    calculado como arreglo. No modifica df.
+    """
+    ages = np.trunc(df['p05h'].to_numpy(dtype='float64'))
+    cohort_start = np.floor_divide(base_year - ages, step) * step
+    return df.assign(cohort_start=cohort_start)
+
+def cohort_labels(cohort_start, step=3):
+    """Etiquetas de texto "inicio-fin" para mostrar (p. ej. 1980-1982)."""
+    return [f"{int(start)}-{int(start) + step - 1}" for start in cohort_start]
+
+def filter_selection_except_generation():
+    """
+    Selección de la barra lateral como {variable: [categorías]}, sin
+    'generation' (la serie por cohorte ya la representa). Incluye las
+    variables sin categorías elegidas: no filtran pero sí definen los grupos.
+    """
+    selection = {}
+    for var in st.session_state.get('selected_vars', []):
         if var == 'generation':
             continue
-        chosen_cats = st.session_state.get(f"cats_{var}", [])
-        if chosen_cats:
-            dff = dff[dff[var].isin(chosen_cats)]
-    return dff
+        selection[var] = list(st.session_state.get(f"cats_{var}", []))
+    return selection
+
+def build_transition_tensor(df, row_mask, label_vars, base_year=2017, step=3):
+    """
+    Conteos [cohorte, grupo, quintil de origen, quintil de destino] de las
+    filas en row_mask. La última cohorte es "edad faltante" y el último
+    destino es "quintil faltante" (cuentan en n de origen, nunca en destino).
+    """
+    origin = df['a_los_14_quintile'].to_numpy(dtype='float64')
+    rows = row_mask & np.isin(origin, [1, 2, 3, 4, 5])
+    df_rows = df.loc[rows, ['p05h', 'a_los_14_quintile', 'actualmente_quintile'] + POSSIBLE_VARS]
+    df_rows = add_cohort_5y_column(df_rows, base_year=base_year, step=step)
+    df_rows, color_column = create_label_column(df_rows, label_vars)
+
+    starts = df_rows['cohort_start'].to_numpy()
+    missing_start = np.isnan(starts)
+    cohorts = np.unique(starts[~missing_start])
+    cohort_codes = np.searchsorted(cohorts, starts)
+    cohort_codes[missing_start] = len(cohorts)
+
+    groups = pd.Categorical(df_rows[color_column])
+    group_codes = groups.codes.astype('int64')
+
+    origin_codes = df_rows['a_los_14_quintile'].to_numpy(dtype='float64').astype('int64') - 1
+    dest = df_rows['actualmente_quintile'].to_numpy(dtype='float64')
+    dest_codes = np.full(len(dest), 5, dtype='int64')
+    dest_valid = np.isin(dest, [1, 2, 3, 4, 5])
+    dest_codes[dest_valid] = dest[dest_valid].astype('int64') - 1
+
+    shape = (len(cohorts) + 1, len(groups.categories), 5, 6)
+    flat = np.ravel_multi_index((cohort_codes, group_codes, origin_codes, dest_codes), shape)
+    counts = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+    return {
+        'cohorts': np.append(cohorts, np.nan),
+        'groups': [str(g) for g in groups.categories],
+        'counts': counts,
+    }
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def load_transition_tensor(label_vars, selection_items, step=3):
+    """Tensor de transiciones por (filtro, paso de cohorte), construido una sola vez."""
+    df = load_and_process_data()
+    row_mask = filter_mask(load_filter_index(), dict(selection_items))
+    return build_transition_tensor(df, row_mask, list(label_vars), step=step)
 
-def create_label_column(df):
+def transition_stats(tensor, origin_quintiles, dest_quintiles):
+    """
+    Suma las rebanadas del tensor para las clases elegidas y devuelve una fila
+    por (cohorte, grupo) con n_origin > 0: cohort_start, group_label,
+    n_origin y n_dest.
+    """
+    origin_idx = sorted(q - 1 for q in origin_quintiles)
+    dest_idx = sorted(q - 1 for q in dest_quintiles)
+    origin_block = tensor['counts'][:, :, origin_idx, :]
+    n_origin = origin_block.sum(axis=(2, 3))
+    n_dest = origin_block[..., dest_idx].sum(axis=(2, 3))
+
+    cohort_idx, group_idx = np.nonzero(n_origin)
+    return pd.DataFrame({
+        'cohort_start': tensor['cohorts'][cohort_idx],
+        'group_label': np.asarray(tensor['groups'], dtype=object)[group_idx],
+        'n_origin': n_origin[cohort_idx, group_idx],
+        'n_dest': n_dest[cohort_idx, group_idx],
+    })
+
+def create_label_column(df, chosen_vars=None):
     """
     Combina las variables seleccionadas (except generation) para 'color'.
+    Si chosen_vars es None se toman de la barra lateral.
+    Devuelve (DataFrame nuevo con 'group_label', 'group_label'); df no se modifica.
     """
-    if 'selected_vars' not in st.session_state:
-        df['group_label'] = "All"
-        return 'group_label'
-    chosen_vars = [v for v in st.session_state['selected_vars'] if v != 'generation']
+    if chosen_vars is None:
+        chosen_vars = [v for v in st.session_state.get('selected_vars', []) if v != 'generation']
     if not chosen_vars:
-        df['group_label'] = "All"
-        return 'group_label'
-
-    def make_label(row):
-        parts = []
-        for v in chosen_vars:
-            parts.append(f"{v}={row[v]}")
-        return " | ".join(parts)
-
-    df['group_label'] = df.apply(make_label, axis=1)
-    return 'group_label'
-
-
-def wilson_ci(successes, n, z=1.96):
-    if n <= 0:
-        return 0.0, 0.0
-    p = successes / n
-    denom = 1 + z**2 / n
-    center = (p + z**2 / (2 * n)) / denom
-    margin = (
-        z
-        * np.sqrt((p * (1 - p) / n) + (z**2 / (4 * n**2)))
-        / denom
-    )
-    lower = max(0.0, center - margin)
-    upper = min(1.0, center + margin)
-    return lower * 100, upper * 100
+        return df.assign(group_label="All"), 'group_label'
+
+    # Producto cartesiano categórico: cada variable se factoriza una vez y el
+    # código combinado indexa la lista de etiquetas "var=valor | var=valor".
+    codes = np.zeros(len(df), dtype='int64')
+    labels = [""]
+    for v in chosen_vars:
+        v_codes, uniques = pd.factorize(df[v], use_na_sentinel=False)
+        v_labels = [f"{v}={u}" for u in uniques]
+        codes = codes * len(v_labels) + v_codes
+        labels = [f"{a} | {b}" if a else b for a in labels for b in v_labels]
+
+    # Categorías en orden alfabético: así groupby y la leyenda ordenan igual que con texto.
+    group_label = pd.Categorical.from_codes(codes, categories=labels)
+    group_label = group_label.reorder_categories(sorted(labels))
+    return df.assign(group_label=group_label), 'group_label'
@@ -1,11 +1,14 @@
 # section3.py
 
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
-import joblib
 import plotly.express as px
 import os
+import sklearn
+
+from model_registry import get_model, load_joblib
 
 # Diccionario para mapear clases a quintiles
 CLASS_TO_QUINTILES = {
@@ -16,22 +19,120 @@ CLASS_TO_QUINTILES = {
     "Alta": [5]
 }
 
+MODELO_PATH = 'models/modelo_entrenado.joblib'
+# Tabla de probabilidades precalculada junto al modelo (una fila por combinación
+# de checkboxes). Solo se usa si todas las variables libres son 0/1 y caben en
+# 2**MAX_LOOKUP_FEATURES filas; si no, se consulta el modelo.
+PROBA_TABLE_PATH = 'models/modelo_entrenado_proba.npz'
+MAX_LOOKUP_FEATURES = 16
+
+
+def model_fingerprint(modelo_path):
+    """Huella del archivo del modelo más la versión de scikit-learn."""
+    digest = hashlib.sha256(sklearn.__version__.encode("utf-8"))
+    with open(modelo_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def build_probability_table(regr, binary_vars):
+    """
+    Evalúa el modelo una sola vez sobre las 2**d combinaciones de las variables
+    binarias que el usuario puede marcar (las demás features quedan en 0).
+    La fila de cada respuesta es sum(valor_i << i) en el orden de feature_names.
+    Devuelve None si el modelo no tiene predict_proba o si d > MAX_LOOKUP_FEATURES.
+    """
+    if not hasattr(regr, "predict_proba"):
+        return None
+    if hasattr(regr, 'feature_names_in_'):
+        modelo_feats = list(regr.feature_names_in_)
+    else:
+        modelo_feats = list(binary_vars)
+    free_feats = [feat for feat in modelo_feats if feat in binary_vars]
+    if len(free_feats) > MAX_LOOKUP_FEATURES:
+        return None
+
+    codes = np.arange(2 ** len(free_feats))
+    bits = (codes[:, None] >> np.arange(len(free_feats))) & 1
+    df_combos = pd.DataFrame(0, index=codes, columns=modelo_feats)
+    df_combos[free_feats] = bits
+    return {
+        "model_features": modelo_feats,
+        "feature_names": free_feats,
+        "classes": np.asarray(regr.classes_),
+        "probs": regr.predict_proba(df_combos),
+    }
+
+
+def save_probability_table(table, modelo_path=MODELO_PATH, table_path=PROBA_TABLE_PATH):
+    np.savez(table_path, fingerprint=model_fingerprint(modelo_path), **table)
+
+
+def load_probability_table_file(modelo_path=MODELO_PATH, table_path=PROBA_TABLE_PATH):
+    """Tabla guardada, o None si no existe o corresponde a otro modelo/versión."""
+    if not os.path.exists(table_path):
+        return None
+    try:
+        with np.load(table_path, allow_pickle=False) as data:
+            if str(data["fingerprint"]) != model_fingerprint(modelo_path):
+                return None
+            return {
+                "model_features": data["model_features"].tolist(),
+                "feature_names": data["feature_names"].tolist(),
+                "classes": data["classes"],
+                "probs": data["probs"],
+            }
+    except Exception:
+        return None
+
+
+def load_section3_model(modelo_path=MODELO_PATH):
+    """Clasificador compartido por todas las sesiones (registro de modelos)."""
+    return get_model(
+        f"section3_classifier:{modelo_path}",
+        lambda: load_joblib(modelo_path),
+        path=modelo_path,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def load_probability_table(modelo_path=MODELO_PATH, binary_vars=()):
+    """
+    Tabla de probabilidades compartida por el proceso. Se lee de PROBA_TABLE_PATH;
+    si falta o está desactualizada se construye con el modelo y se intenta guardar.
+    """
+    table = load_probability_table_file(modelo_path)
+    if table is not None:
+        free_feats = [feat for feat in table["model_features"] if feat in binary_vars]
+        if free_feats == table["feature_names"]:
+            return table
+    table = build_probability_table(load_section3_model(modelo_path), binary_vars)
+    if table is not None:
+        try:
+            save_probability_table(table, modelo_path)
+        except Exception:
+            pass
+    return table
+
+
+def lookup_probabilities(table, datos_usuario):
+    """Probabilidades de la tabla para las respuestas 0/1; None si alguna no es binaria."""
+    values = [datos_usuario.get(feat, 0) for feat in table["feature_names"]]
+    if any(value not in (0, 1) for value in values):
+        return None
+    code = sum(int(value) << i for i, value in enumerate(values))
+    return table["probs"][code]
+
 def show_section3():
     # Quitar título de la sección
     # st.title("")
 
-    # Cargar el modelo si no está en session_state
-    modelo_path = 'models/modelo_entrenado.joblib'
+    modelo_path = MODELO_PATH
     if not os.path.exists(modelo_path):
         st.error(f"No se encontró el archivo de modelo '{modelo_path}'.")
         return
 
-    if 'modelo_regr' not in st.session_state:
-        regr = joblib.load(modelo_path)
-        st.session_state['modelo_regr'] = regr
-    else:
-        regr = st.session_state['modelo_regr']
-
     # Variables que el usuario marcará (0/1)
     # variables = {
     #     'p126d': 'Horno de microondas',
@@ -214,25 +315,36 @@ def show_section3():
             is_checked = st.session_state.get(f"chk_{var}", False)
             datos_usuario[var] = 1 if is_checked else 0
 
-        df_usuario = pd.DataFrame([datos_usuario])
+        # Camino rápido: fila de la tabla precalculada (sin llamar a sklearn).
+        probs = None
+        table = load_probability_table(modelo_path, tuple(variables))
+        if table is not None:
+            probs = lookup_probabilities(table, datos_usuario)
+            clases = table["classes"]
 
-        # Orden de features
-        if hasattr(regr, 'feature_names_in_'):
-            modelo_feats = list(regr.feature_names_in_)
-        else:
-            modelo_feats = list(variables.keys())
+        if probs is None:
+            # Modelo compartido por el proceso (se carga en el primer uso)
+            regr = load_section3_model(modelo_path)
+
+            df_usuario = pd.DataFrame([datos_usuario])
+
+            # Orden de features
+            if hasattr(regr, 'feature_names_in_'):
+                modelo_feats = list(regr.feature_names_in_)
+            else:
+                modelo_feats = list(variables.keys())
 
-        # Asegurar todas las columnas
-        for feat in modelo_feats:
-            if feat not in df_usuario.columns:
-                df_usuario[feat] = 0
-        df_usuario = df_usuario[modelo_feats]
+            # Asegurar todas las columnas
+            for feat in modelo_feats:
+                if feat not in df_usuario.columns:
+                    df_usuario[feat] = 0
+            df_usuario = df_usuario[modelo_feats]
 
-        if hasattr(regr, "predict_proba"):
-            probabilidades = regr.predict_proba(df_usuario)
-            clases = regr.classes_
-            probs = probabilidades[0]
+            if hasattr(regr, "predict_proba"):
+                probs = regr.predict_proba(df_usuario)[0]
+                clases = regr.classes_
 
+        if probs is not None:
             # Mapeo 1..5 => texto
             class_mapping = {
                 1: "Baja Baja",
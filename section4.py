@@ -1,5 +1,5 @@
-import re
-import json
+import os
+from itertools import chain
 from pathlib import Path
 from textwrap import dedent
 
@@ -7,13 +7,31 @@ import joblib
 import numpy as np
 import pandas as pd
 import streamlit as st
-from sklearn.impute import SimpleImputer
-from sklearn.neighbors import NearestNeighbors
-from sklearn.preprocessing import StandardScaler
 
+from model_registry import get_model
 from utils.diccionarios import get_data_desc, get_nuevo_diccionario
-from utils.func_s4 import construir_descripciones_cluster
-from llm.gemini_explainer import generate_explanation
+from utils.func_s4 import compilar_regla_cluster, compilar_reglas_cluster
+from utils.knn_s4 import (
+    DEFAULT_KNN_BACKEND,
+    build_knn_indexes,
+    fit_knn_index,
+    knn_index_path,
+    load_knn_indexes_file,
+    neighbour_cluster_counts,
+    save_knn_indexes,
+)
+from utils.store_s4 import load_section4_store, store_path, write_section4_store
+from llm.client_pool import ClientPool
+from llm.executor import BoundedExecutor, ExecutorBusy
+from llm.explanation_cache import explanation_key, make_explanation_cache
+from llm.gemini_explainer import (
+    DEFAULT_MODEL_NAME,
+    GENERATION_FALLBACK_MSG,
+    build_context_text,
+    is_cacheable_explanation,
+    resolve_api_key,
+    stream_explanation,
+)
 
 BASE_PATH = Path("data")
 TARGET_LABELS = {
@@ -27,20 +45,55 @@ TARGET_LABELS = {
     "OBJ_subieron": "Ascendieron",
     "OBJ_bajaron": "Descendieron",
 }
+EXPLANATION_TIMEOUT_SECONDS = float(os.getenv("EXPLANATION_TIMEOUT_SECONDS", "60"))
+EXPLANATION_TIMEOUT_MSG = (
+    "La explicación está tardando más de lo esperado. "
+    "Vuelve a pedir el diagnóstico en unos momentos."
+)
+EXPLANATION_BUSY_MSG = "Hay muchas explicaciones en proceso, reintenta en unos momentos."
 EXCLUDED_IMPORTANCE_VARS = {"p133", "CIUO2", "p23"}
 BASE_QUESTIONS = ["p05", "p86", "p33_f"]
 
 
-@st.cache_resource(show_spinner=False)
-def load_section4_assets(base_path: str = "data"):
+def load_section4_sources(base_path: str = "data"):
+    """Lee los artefactos originales (joblib + CSV) y arma las proyecciones."""
     base = Path(base_path)
+    df_valiosas_dict = joblib.load(base / "df_valiosas_dict.joblib")
+    df_clusterizados = pd.read_csv(base / "df_clusterizados_total_origi.csv")
     return {
-        "df_valiosas_dict": joblib.load(base / "df_valiosas_dict.joblib"),
+        "df_valiosas_dict": df_valiosas_dict,
         "df_feature_importances_total": joblib.load(base / "df_feature_importances_total.joblib"),
-        "df_clusterizados_total_origi": pd.read_csv(base / "df_clusterizados_total_origi.csv"),
+        "df_clusterizados_total_origi": df_clusterizados,
+        "target_projections": build_target_projections(df_clusterizados, df_valiosas_dict.keys()),
     }
 
 
+def load_section4_assets(base_path: str = "data"):
+    """
+    Artefactos de la Sección 4 compartidos entre sesiones (registro de modelos).
+    Se abren desde el almacén binario (`python -m utils.store_s4`) de forma
+    perezosa; si falta o está desactualizado se leen las fuentes una vez y se
+    intenta escribirlo.
+    """
+    return get_model(
+        f"section4_assets:{base_path}",
+        lambda: _open_section4_assets(base_path),
+        path=str(store_path(base_path)),
+    )
+
+
+def _open_section4_assets(base_path):
+    assets = load_section4_store(base_path)
+    if assets is not None:
+        return assets
+    assets = load_section4_sources(base_path)
+    try:
+        write_section4_store(assets, base_path)
+    except Exception:
+        pass
+    return assets
+
+
 def generar_lista_preguntas(data_desc):
     preguntas = []
     for var, info in data_desc.items():
@@ -126,14 +179,26 @@ def cuestionario_general(data_desc, cols_per_row=3):
     return aplicar_cuestionario_en_columnas(preguntas, cols_per_row)
 
 
-def build_cluster_target_frame(df_cluster, user_selected_target):
-    prefix = f"{user_selected_target}_"
-    rename_map = {
-        col: col.replace(prefix, "")
-        for col in df_cluster.columns
-        if col.startswith(prefix)
-    }
-    return df_cluster.rename(columns=rename_map)
+def build_target_projections(df_cluster, targets):
+    """
+    Separa una sola vez los datos clusterizados por target: matriz float64 de
+    solo lectura con las preguntas (columnas sin prefijo OBJ_) de las filas
+    con {target}_cluster != -1, el vector de clusters y la posición de cada
+    columna. Así el cálculo por consulta no renombra ni copia DataFrames.
+    """
+    feature_cols = [col for col in df_cluster.columns if not col.startswith("OBJ_")]
+    columns = {col: pos for pos, col in enumerate(feature_cols)}
+    X = df_cluster[feature_cols].to_numpy(dtype="float64")
+    projections = {}
+    for target in targets:
+        clusters = df_cluster[f"{target}_cluster"].to_numpy()
+        valid = clusters != -1
+        X_target = X[valid]
+        X_target.setflags(write=False)
+        clusters = clusters[valid]
+        clusters.setflags(write=False)
+        projections[target] = {"X": X_target, "clusters": clusters, "columns": columns}
+    return projections
 
 
 def get_question_pool(df_feature_import, user_selected_target):
@@ -147,43 +212,138 @@ def get_question_pool(df_feature_import, user_selected_target):
     return sorted(set(BASE_QUESTIONS + top_vars))
 
 
+def section4_question_sets(assets):
+    """
+    Variables del cuestionario de cada target, en el mismo orden en que
+    show_section4 arma df_respuestas (pool de preguntas con descripción y
+    presentes en los datos clusterizados).
+    """
+    data_desc = get_data_desc()
+    question_sets = {}
+    for target, proyeccion in assets["target_projections"].items():
+        pool = get_question_pool(assets["df_feature_importances_total"], target)
+        question_sets[target] = [
+            var for var in pool if var in data_desc and var in proyeccion["columns"]
+        ]
+    return question_sets
+
+
+def build_section4_knn_indexes(assets, backend=DEFAULT_KNN_BACKEND, **backend_params):
+    """Ajusta el índice KNN de cada target (paso offline de utils.knn_s4)."""
+    return build_knn_indexes(
+        assets["target_projections"],
+        section4_question_sets(assets),
+        backend=backend,
+        **backend_params,
+    )
+
+
+def load_knn_indexes(base_path: str = "data", backend: str = DEFAULT_KNN_BACKEND, **backend_params):
+    """
+    Índices KNN por target, compartidos entre sesiones (registro de modelos).
+    Se leen del archivo generado con `python -m utils.knn_s4`; si falta o está
+    desactualizado se construyen una vez en este proceso y se intenta guardarlos.
+    """
+    path = knn_index_path(base_path, backend, **backend_params)
+    return get_model(
+        f"section4_knn_indexes:{path}",
+        lambda: _open_knn_indexes(base_path, backend, backend_params),
+        path=str(path),
+    )
+
+
+def _open_knn_indexes(base_path, backend, backend_params):
+    indexes = load_knn_indexes_file(base_path, backend=backend, **backend_params)
+    if indexes is None:
+        indexes = build_section4_knn_indexes(
+            load_section4_assets(base_path), backend=backend, **backend_params
+        )
+        try:
+            save_knn_indexes(indexes, base_path, backend=backend, **backend_params)
+        except Exception:
+            pass
+    return indexes
+
+
+@st.cache_resource(show_spinner=False)
+def load_cluster_rules(base_path: str = "data"):
+    """
+    Reglas de todos los clusters (de todos los targets) compiladas una vez por
+    proceso: {cluster_descripcion: regla} para build_cluster_results (y para
+    construir_descripciones_cluster cuando se necesita el texto).
+    """
+    assets = load_section4_assets(base_path)
+    descripciones = [
+        desc
+        for df_valiosas in assets["df_valiosas_dict"].values()
+        for desc in df_valiosas["cluster_descripcion"]
+    ]
+    return compilar_reglas_cluster(descripciones, get_data_desc(), get_nuevo_diccionario())
+
+
 def obtener_vecinos_de_mi_respuesta(
     df_respuestas,
-    df_datos_clusterizados,
+    proyeccion_target,
     df_datos_descript_valiosas,
     n_vecinos=20,
+    knn_index=None,
 ):
-    datos_validos = df_datos_clusterizados[df_datos_clusterizados["cluster"] != -1].copy()
-
+    """
+    Busca los n_vecinos más cercanos a la respuesta del usuario y cuenta sus
+    clusters. proyeccion_target viene de assets["target_projections"]. Si
+    knn_index (de load_knn_indexes) corresponde a las mismas variables se usa
+    directamente; si no, se ajusta un índice para esta consulta.
+    """
+    columnas = proyeccion_target["columns"]
     variables_usuario = df_respuestas["variable"].tolist()
-    variables_usuario = [v for v in variables_usuario if v in datos_validos.columns]
+    variables_usuario = [v for v in variables_usuario if v in columnas]
     if not variables_usuario:
         return df_datos_descript_valiosas.iloc[0:0].copy()
 
     respuesta_usuario = df_respuestas.set_index("variable")["respuesta_codigo"].to_dict()
     user_vector = pd.Series(respuesta_usuario, index=variables_usuario).values.reshape(1, -1)
-    X = datos_validos[variables_usuario].values
 
-    imputer = SimpleImputer(strategy="mean")
-    X = imputer.fit_transform(X)
-    user_vector = imputer.transform(user_vector)
+    if knn_index is None or knn_index["variables"] != variables_usuario:
+        knn_index = fit_knn_index(
+            proyeccion_target["X"][:, [columnas[v] for v in variables_usuario]],
+            proyeccion_target["clusters"],
+            variables_usuario,
+        )
+    df_clusters = neighbour_cluster_counts(knn_index, user_vector, n_vecinos).drop(columns="fila")
 
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    user_vector_scaled = scaler.transform(user_vector)
+    return df_datos_descript_valiosas.merge(df_clusters, on="cluster", how="inner").sort_values(
+        by=["count", "cluster"], ascending=[False, True], kind="stable"
+    )
 
-    knn = NearestNeighbors(n_neighbors=n_vecinos, metric="euclidean")
-    knn.fit(X_scaled)
-    distances, indices = knn.kneighbors(user_vector_scaled)
 
-    vecinos = datos_validos.iloc[indices[0]].copy()
-    vecinos["distancia"] = distances[0]
+def obtener_vecinos_lote(respuestas, df_datos_descript_valiosas, knn_index, n_vecinos=20):
+    """
+    Versión por lotes de obtener_vecinos_de_mi_respuesta para diagnósticos
+    masivos: respuestas es una matriz N x d (o DataFrame con las columnas de
+    knn_index["variables"]). Hace una sola consulta kneighbors y un solo merge;
+    el resultado trae la columna "fila" con la posición de cada cuestionario
+    y, dentro de cada fila, el mismo orden que la consulta individual (count
+    descendente, empates por cluster).
+    """
+    if isinstance(respuestas, pd.DataFrame):
+        respuestas = respuestas[knn_index["variables"]].to_numpy(dtype="float64")
+    df_clusters = neighbour_cluster_counts(knn_index, respuestas, n_vecinos)
+    df_lote = df_datos_descript_valiosas.merge(df_clusters, on="cluster", how="inner")
+    # Dentro de cada fila el índice es la posición en el orden de
+    # df_datos_descript_valiosas, igual que en la consulta individual.
+    df_lote = df_lote.sort_values(by="fila", kind="stable")
+    df_lote.index = df_lote.groupby("fila").cumcount().to_numpy()
+    return df_lote.sort_values(
+        by=["fila", "count", "cluster"], ascending=[True, False, True], kind="stable"
+    )
 
-    df_clusters = vecinos["cluster"].value_counts().reset_index()
-    df_clusters.columns = ["cluster", "count"]
 
-    return df_datos_descript_valiosas.merge(df_clusters, on="cluster", how="inner").sort_values(
-        by="count", ascending=False
+def diagnosticar_lote(respuestas, target, n_vecinos=50, base_path="data"):
+    """Vecinos por lotes contra el índice pre-entrenado de un target."""
+    assets = load_section4_assets(base_path)
+    knn_index = load_knn_indexes(base_path)[target]
+    return obtener_vecinos_lote(
+        respuestas, assets["df_valiosas_dict"][target], knn_index, n_vecinos=n_vecinos
     )
 
 
@@ -210,96 +370,104 @@ def map_confidence(value):
     return "Muy Alta"
 
 
-def parse_cluster_description(raw_desc):
-    lines = raw_desc.split("\n")
-    summary_data = {}
-    var_blocks = []
-    current_block = []
-    in_variables_section = False
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("- Variables y rangos:"):
-            in_variables_section = True
-            continue
+def _format_obs(n_sample):
+    try:
+        n_sample = float(n_sample)
+    except (TypeError, ValueError):
+        return "no disponible"
+    if np.isnan(n_sample):
+        return "no disponible"
+    return str(int(n_sample)) if n_sample.is_integer() else str(n_sample)
 
-        if not in_variables_section:
-            if stripped.startswith("- Incremento de probabilidad"):
-                try:
-                    incremento = float(stripped.split(":", 1)[1].strip())
-                    diff_percent = (incremento - 1.0) * 100
-                    summary_data["incremento"] = {
-                        "text": f"{diff_percent:+.0f}%",
-                        "color": get_color_for_increment(incremento - 1.0),
-                    }
-                except Exception:
-                    summary_data["incremento"] = {"text": stripped, "color": "#666666"}
-            elif stripped.startswith("- Probabilidad:"):
-                summary_data["probabilidad"] = stripped.split(":", 1)[1].strip()
-            elif stripped.startswith("- Nivel de confianza"):
-                conf_val = stripped.split(":", 1)[1].strip()
-                match_obs = re.search(r"\((\d+)\s+obs\)", conf_val)
-                summary_data["obs"] = match_obs.group(1) if match_obs else "no disponible"
-                conf_numeric = conf_val.split("(", 1)[0].strip()
-                summary_data["confianza"] = map_confidence(conf_numeric)
-            continue
 
-        if stripped.startswith("- Variable:"):
-            if current_block:
-                var_blocks.append(current_block)
-            current_block = [stripped]
-        elif current_block:
-            current_block.append(stripped)
+def summarize_cluster(n_proba, probabilidad, n_sample, nivel_confianza):
+    """Resumen del escenario (incremento, probabilidad, confianza, obs) de un cluster."""
+    summary_data = {}
+    if n_proba is not None:
+        # Incremento redondeado a 2 decimales, como se muestra en el texto del cluster.
+        incremento = round(float(n_proba), 2)
+        diff_percent = (incremento - 1.0) * 100
+        summary_data["incremento"] = {
+            "text": f"{diff_percent:+.0f}%",
+            "color": get_color_for_increment(incremento - 1.0),
+        }
+    if probabilidad is not None:
+        summary_data["probabilidad"] = f"{probabilidad:.1%}"
+    summary_data["obs"] = _format_obs(n_sample)
+    summary_data["confianza"] = (
+        "no disponible" if nivel_confianza is None else map_confidence(nivel_confianza)
+    )
+    return summary_data
 
-    if current_block:
-        var_blocks.append(current_block)
 
+def rule_variables(regla):
+    """
+    Variables clave de una regla compilada (utils.func_s4.compilar_regla_cluster)
+    en el formato de las tarjetas y del contexto del LLM. Se omiten las
+    condiciones sin descripción o sin categorías en rango.
+    """
     variables = []
-    for block in var_blocks:
-        var_info = {}
+    for cond in regla["condiciones"]:
+        if "variable" not in cond or not cond["descripcion"] or not cond["categorias"]:
+            continue
+        cambio = cond["cambio"]
         extra_props = []
-        for line in block:
-            if line.startswith("- Descripción:"):
-                var_info["descripcion"] = line.split(":", 1)[1].strip()
-            elif line.startswith("- Categorías en rango:"):
-                categories_raw = line.split(":", 1)[1].strip()
-                if "|" in categories_raw:
-                    parts = categories_raw.split("|")
-                else:
-                    parts = categories_raw.split(",")
-
-                cat_values = []
-                for part in parts:
-                    if "=" in part:
-                        cat_values.append(part.split("=", 1)[1].strip())
-                var_info["categorias"] = " | ".join(cat_values)
-            elif line.startswith("- ¿Puedo cambiarlo yo?:"):
-                val = line.split(":", 1)[1].strip()
-                var_info["change_level"] = val
-                if val.lower() != "no_aplica":
-                    extra_props.append(f"¿Puedo cambiarlo yo?: {val}")
-            elif line.startswith("- Involucrados:"):
-                var_info["involucrados"] = line.split(':', 1)[1].strip()
-                extra_props.append(f"Involucrados: {line.split(':', 1)[1].strip()}")
-            elif line.startswith("- Recursos:"):
-                val = line.split(":", 1)[1].strip()
-                var_info["recursos"] = val
-                if val.lower() != "no_aplica":
-                    extra_props.append(f"Recursos: {val}")
-
-        if "descripcion" in var_info and "categorias" in var_info:
-            variables.append(
-                {
-                    "descripcion": var_info["descripcion"],
-                    "categorias": var_info["categorias"],
-                    "change_level": var_info.get("change_level", "no disponible"),
-                    "involucrados": var_info.get("involucrados", "no disponible"),
-                    "recursos": var_info.get("recursos", "no disponible"),
-                    "extras": extra_props,
-                }
-            )
-
-    return {"summary": summary_data, "variables": variables}
+        change_level = cambio.get("puedo_cambiarlo_yo")
+        if change_level is not None and str(change_level).lower() != "no_aplica":
+            extra_props.append(f"¿Puedo cambiarlo yo?: {change_level}")
+        involucrados = cambio.get("involucrados")
+        if involucrados is not None:
+            involucrados = ", ".join(involucrados)
+            extra_props.append(f"Involucrados: {involucrados}")
+        recursos = cambio.get("recursos_necesarios")
+        if recursos is not None:
+            recursos = ", ".join(recursos)
+            if recursos.lower() != "no_aplica":
+                extra_props.append(f"Recursos: {recursos}")
+        variables.append(
+            {
+                "descripcion": str(cond["descripcion"]).strip(),
+                "categorias": " | ".join(str(etiq).strip() for _, etiq in cond["categorias"]),
+                "change_level": "no disponible" if change_level is None else change_level,
+                "involucrados": "no disponible" if involucrados is None else involucrados,
+                "recursos": "no disponible" if recursos is None else recursos,
+                "extras": extra_props,
+            }
+        )
+    return variables
+
+
+def build_cluster_results(df_resultados, reglas_compiladas, data_desc, nuevo_diccionario):
+    """
+    Resultados estructurados por cluster ({nombre: {"summary", "variables"}})
+    directamente desde las filas seleccionadas y las reglas compiladas, sin
+    pasar por el texto markdown de construir_descripciones_cluster. El nombre
+    de cada cluster es el índice de su fila, igual que en ese texto.
+    """
+    columnas = df_resultados.columns
+
+    def columna(nombre):
+        if nombre in columnas:
+            return df_resultados[nombre].tolist()
+        return [None] * len(df_resultados)
+
+    results = {}
+    for idx, desc, n_proba, probabilidad, n_sample, nivel in zip(
+        df_resultados.index,
+        df_resultados["cluster_descripcion"],
+        columna("cluster_N_Proba"),
+        columna("cluster_ef_sample"),
+        columna("cluster_n_sample"),
+        columna("nivel_de_confianza_cluster"),
+    ):
+        regla = reglas_compiladas.get(desc)
+        if regla is None:
+            regla = compilar_regla_cluster(desc, data_desc, nuevo_diccionario)
+        results[idx] = {
+            "summary": summarize_cluster(n_proba, probabilidad, n_sample, nivel),
+            "variables": rule_variables(regla),
+        }
+    return results
 
 
 def normalize_variable_signature(variables):
@@ -392,9 +560,10 @@ def format_grouped_scenarios_card(group_idx, group_data):
     ).strip()
 
 
-def format_all_clusters(resultado):
-    parsed_clusters = {cluster_id: parse_cluster_description(desc) for cluster_id, desc in resultado.items()}
-    return group_clusters_by_variables(parsed_clusters)
+def format_all_clusters(df_resultados, reglas_compiladas, data_desc, nuevo_diccionario):
+    return group_clusters_by_variables(
+        build_cluster_results(df_resultados, reglas_compiladas, data_desc, nuevo_diccionario)
+    )
 
 
 def has_low_reliability(groups):
@@ -439,11 +608,124 @@ def get_active_filters_from_session():
     return filters
 
 
-@st.cache_data(ttl=1800, show_spinner=False)
-def cached_generate_explanation(app_state_json: str):
-    return generate_explanation(json.loads(app_state_json))
+@st.cache_resource(show_spinner=False)
+def get_explanation_cache():
+    """
+    Caché de explicaciones compartida por todas las sesiones. Con
+    EXPLANATION_CACHE_PATH definido se guarda en SQLite (p. ej.
+    data/cache/explanations.sqlite); si no, en memoria.
+    """
+    return make_explanation_cache(
+        sqlite_path=os.getenv("EXPLANATION_CACHE_PATH") or None,
+        max_entries=int(os.getenv("EXPLANATION_CACHE_MAX_ENTRIES", "512")),
+        ttl_seconds=float(os.getenv("EXPLANATION_CACHE_TTL_SECONDS", "1800")),
+        should_cache=is_cacheable_explanation,
+    )
 
 
+def _explanation_job(app_state):
+    """
+    Llave de caché (hash del contexto completo enviado al modelo, con el
+    cuestionario, y del nombre del modelo; la clave de API no entra) y
+    productor de los fragmentos de la explicación.
+    """
+    context_text = build_context_text(app_state)
+    key = explanation_key(context_text, app_state.get("model_name", DEFAULT_MODEL_NAME))
+    provider = get_explanation_provider(app_state)
+    return key, lambda: stream_explanation(app_state, context_text, provider)
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_client_pool():
+    """Clientes de LLM compartidos por credencial, con reintentos y circuit breaker."""
+    return ClientPool.from_env()
+
+
+def get_explanation_provider(app_state):
+    """
+    Proveedor del pool para la clave de la app. None si no hay clave o falta
+    google-genai: stream_explanation lo convierte en el mensaje correspondiente.
+    """
+    try:
+        return get_llm_client_pool().get(resolve_api_key(app_state))
+    except ImportError:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def get_explanation_executor():
+    """Hilos compartidos para las llamadas al LLM (EXPLANATION_WORKERS, EXPLANATION_MAX_PENDING)."""
+    return BoundedExecutor(
+        max_workers=int(os.getenv("EXPLANATION_WORKERS", "4")),
+        max_pending=int(os.getenv("EXPLANATION_MAX_PENDING", "32")),
+    )
+
+
+def _readable_chunks(chunks):
+    """Convierte los errores del stream (tiempo agotado, cancelación, fallas) en texto."""
+    produced = False
+    try:
+        for chunk in chunks:
+            produced = True
+            yield chunk
+    except TimeoutError:
+        yield f"\n\n{EXPLANATION_TIMEOUT_MSG}" if produced else EXPLANATION_TIMEOUT_MSG
+    except Exception:
+        yield f"\n\n{GENERATION_FALLBACK_MSG}" if produced else GENERATION_FALLBACK_MSG
+
+
+def start_explanation(app_state):
+    """
+    Lanza la explicación en segundo plano (o la toma de la caché) y devuelve
+    un iterador de sus fragmentos para st.write_stream. La sesión abandona la
+    petición anterior; esta se cancela solo si seguía en cola y ninguna otra
+    sesión la sigue. Una llamada que ya empezó no se puede detener: termina y
+    se guarda en caché aunque nadie la lea. Del mismo modo, el tiempo agotado
+    (EXPLANATION_TIMEOUT_SECONDS) solo deja de esperar al lector; el hilo del
+    ejecutor sigue ocupado hasta que el proveedor responda.
+    """
+    cache = get_explanation_cache()
+    previous = st.session_state.pop("section4_explanation_inflight", None)
+    if previous is not None:
+        cache.leave(*previous)
+
+    key, produce = _explanation_job(app_state)
+    try:
+        chunks, inflight = cache.stream(
+            key,
+            produce,
+            get_explanation_executor().submit,
+            timeout=EXPLANATION_TIMEOUT_SECONDS,
+        )
+    except ExecutorBusy:
+        return iter([EXPLANATION_BUSY_MSG])
+    if inflight is not None:
+        st.session_state["section4_explanation_inflight"] = (key, inflight)
+    return _readable_chunks(chunks)
+
+
+def group_neighbour_results(df_resultados, data_desc, base_path=str(BASE_PATH)):
+    """
+    De los clusters vecinos a los grupos de las tarjetas: nivel de confianza
+    por cuartil de cluster_N_Proba, filtro de clusters accionables y
+    agrupación por variables clave.
+    """
+    if not df_resultados.empty and "cluster_N_Proba" in df_resultados.columns:
+        df_resultados["nivel_de_confianza_cluster"] = pd.qcut(
+            df_resultados["cluster_N_Proba"],
+            q=4,
+            labels=False,
+            duplicates="drop",
+        )
+
+    df_filtrado = filter_cluster_results(df_resultados)
+
+    return format_all_clusters(
+        df_filtrado,
+        load_cluster_rules(base_path),
+        data_desc,
+        get_nuevo_diccionario(),
+    )
 
 
 def _collapse_questionnaire_after_submit():
@@ -468,11 +750,6 @@ def show_section4():
         st.session_state["section4_last_target"] = user_selected_target
         st.session_state["section4_form_expanded"] = True
 
-    df_cluster_target = build_cluster_target_frame(
-        assets["df_clusterizados_total_origi"],
-        user_selected_target,
-    )
-
     preguntas_lista = get_question_pool(
         assets["df_feature_importances_total"],
         user_selected_target,
@@ -494,31 +771,13 @@ def show_section4():
     df_valiosas = assets["df_valiosas_dict"][user_selected_target]
     df_resultados = obtener_vecinos_de_mi_respuesta(
         df_respuestas,
-        df_cluster_target,
+        assets["target_projections"][user_selected_target],
         df_valiosas,
         n_vecinos=50,
+        knn_index=load_knn_indexes(str(BASE_PATH)).get(user_selected_target),
     )
 
-    if not df_resultados.empty and "cluster_N_Proba" in df_resultados.columns:
-        df_resultados["nivel_de_confianza_cluster"] = pd.qcut(
-            df_resultados["cluster_N_Proba"],
-            q=4,
-            labels=False,
-            duplicates="drop",
-        )
-
-    df_filtrado = filter_cluster_results(df_resultados)
-
-    resultado = construir_descripciones_cluster(
-        df_filtrado,
-        data_desc_global,
-        get_nuevo_diccionario(),
-        language="es",
-        show_N_probabilidad=True,
-        show_Probabilidad=True,
-    )
-
-    grouped_results = format_all_clusters(resultado)
+    grouped_results = group_neighbour_results(df_resultados, data_desc_global)
 
     app_state = {
         "target": user_selected_target,
@@ -529,12 +788,11 @@ def show_section4():
         "gemini_api_key": get_gemini_api_key(),
     }
 
+    # La explicación se pide en segundo plano: las tarjetas se dibujan ya y
+    # el texto llena su espacio en streaming conforme llega.
+    explanation_chunks = start_explanation(app_state)
     st.write("### Explicación personalizada (IA)")
-    with st.spinner("Generando diagnóstico..."):
-        explanation = cached_generate_explanation(
-            json.dumps(app_state, ensure_ascii=False, sort_keys=True)
-        )
-    st.markdown(explanation)
+    explanation_slot = st.empty()
 
     if has_low_reliability(grouped_results):
         st.warning(
@@ -548,3 +806,11 @@ def show_section4():
             format_grouped_scenarios_card(group_idx, group_data),
             unsafe_allow_html=True,
         )
+
+    with explanation_slot.container():
+        with st.spinner("Generando diagnóstico..."):
+            first_chunk = next(explanation_chunks, "")
+        st.write_stream(chain([first_chunk], explanation_chunks))
+    finished = st.session_state.pop("section4_explanation_inflight", None)
+    if finished is not None:
+        get_explanation_cache().leave(*finished)
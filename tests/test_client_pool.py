@@ -0,0 +1,119 @@
+import threading
+
+import httpx
+import pytest
+from google.genai import errors as genai_errors
+
+from llm.client_pool import (
+    CircuitBreaker,
+    CircuitOpen,
+    LLMMetrics,
+    ResilientProvider,
+    is_retryable,
+)
+from llm.providers import FakeProvider
+
+
+class FlakyProvider(FakeProvider):
+    """Lanza los errores de `failures` en orden y después responde normal."""
+
+    def __init__(self, failures, **kwargs):
+        super().__init__(**kwargs)
+        self.failures = list(failures)
+
+    def stream(self, model, system_instruction, contents):
+        if self.failures:
+            self.calls += 1
+            raise self.failures.pop(0)
+        yield from super().stream(model, system_instruction, contents)
+
+
+def server_error(code=503):
+    return genai_errors.ServerError(code, {"error": {"code": code, "message": "x", "status": "UNAVAILABLE"}})
+
+
+def make_provider(provider, breaker=None, max_retries=3):
+    return ResilientProvider(
+        provider,
+        threading.BoundedSemaphore(4),
+        breaker or CircuitBreaker(failure_threshold=1, reset_seconds=30),
+        LLMMetrics(),
+        max_retries=max_retries,
+        sleep=lambda _: None,
+    )
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        (httpx.ReadTimeout("timeout"), True),
+        (httpx.ConnectError("connect"), True),
+        (server_error(), True),
+        (genai_errors.ClientError(429, {"error": {"code": 429, "message": "x", "status": "RESOURCE_EXHAUSTED"}}), True),
+        (genai_errors.ClientError(400, {"error": {"code": 400, "message": "x", "status": "INVALID_ARGUMENT"}}), False),
+        (ValueError("x"), False),
+    ],
+)
+def test_is_retryable(exc, expected):
+    assert is_retryable(exc) is expected
+
+
+@pytest.mark.parametrize(
+    "failures",
+    [
+        [httpx.ReadTimeout("timeout"), httpx.ReadTimeout("timeout")],
+        [httpx.ConnectError("connect"), server_error()],
+    ],
+)
+def test_transient_transport_errors_are_retried(failures):
+    provider = FlakyProvider(failures, text="hola")
+    resilient = make_provider(provider)
+
+    assert resilient.generate("m", "s", "c") == "hola"
+    assert provider.calls == 3
+    assert resilient.metrics.snapshot()["retries"] == 2
+    assert resilient.breaker.state == "closed"
+
+
+def test_exhausted_retries_open_the_breaker():
+    provider = FakeProvider(error=httpx.ConnectError("connect"))
+    resilient = make_provider(provider, max_retries=2)
+
+    with pytest.raises(httpx.ConnectError):
+        resilient.generate("m", "s", "c")
+    assert provider.calls == 3
+    assert resilient.breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        resilient.generate("m", "s", "c")
+
+
+def test_half_open_lets_a_single_probe_through():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow() is None
+
+    now[0] = 10.0
+    assert breaker.allow() == "probe"
+    assert breaker.allow() is None
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() == "call"
+
+
+def test_abandoned_probe_stream_releases_the_probe():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 10.0
+    resilient = make_provider(FakeProvider(text="abcdef", chunk_size=2), breaker=breaker)
+
+    chunks = resilient.stream("m", "s", "c")
+    assert next(chunks) == "ab"
+    with pytest.raises(CircuitOpen):
+        resilient.generate("m", "s", "c")
+    chunks.close()
+
+    assert breaker.state == "half_open"
+    assert resilient.generate("m", "s", "c") == "abcdef"
+    assert breaker.state == "closed"
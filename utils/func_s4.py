@@ -1,5 +1,116 @@
 import re
 
+# Mensajes en español/inglés según el parámetro `language`
+TEXTOS = {
+    'es': {
+        'cluster': "Cluster",
+        'original': "Descripción original",
+        'condiciones': "Variables y rangos:",
+        'prob': "Probabilidad",
+        'conf': "Nivel de confianza (Baja:0, Alta 3)",
+        'N_prob': "Incremento de probabilidad respecto a la media",
+        'variable': "Variable",
+        'range': "Rango",
+        'desc': "Descripción",
+        'cat': "Categorías en rango",
+        'no_cat': "No categorías identificadas en este rango",
+        'puedo': "¿Puedo cambiarlo yo?",
+        'gob': "¿Puede cambiarlo el gobierno?",
+        'invol': "Involucrados",
+        'recursos': "Recursos",
+    },
+    'en': {
+        'cluster': "Group",
+        'original': "Original description",
+        'condiciones': "Variables and ranges:",
+        'prob': "Probability",
+        'conf': "Confidence Level (Low: 0, High: 3)",
+        'N_prob': "Probability increment over average",
+        'variable': "Variable",
+        'range': "Range",
+        'desc': "Description",
+        'cat': "Categories in range",
+        'no_cat': "No categories identified in this range",
+        'puedo': "Can I change it?",
+        'gob': "Can the government change it?",
+        'invol': "Involved",
+        'recursos': "Resources",
+    },
+}
+
+# Regex para extraer límites y variable:
+# Ejemplo: "2.5 <= p133 <= 10.0"
+PATRON_INTERVALO = re.compile(
+    r'([+\-]?\d+(?:\.\d+)?)\s*<=\s*([^\s]+)\s*<=\s*([+\-]?\d+(?:\.\d+)?)'
+)
+
+
+def try_convert(val):
+    """Intenta convertir a int o float; si no es numérico regresa el valor original."""
+    try:
+        return int(val)
+    except ValueError:
+        try:
+            return float(val)
+        except ValueError:
+            return val
+
+
+def compilar_regla_cluster(desc_cruda, data_desc, nuevo_diccionario):
+    """
+    Parsea una 'cluster_descripcion' una sola vez y devuelve un registro con
+    sus condiciones: variable, límites (texto original y float), descripción,
+    categorías en rango [(valor, etiqueta)] y metadatos de cambio de
+    nuevo_diccionario. Las condiciones que no siguen el patrón
+    "a <= var <= b" se guardan como {'texto': cond}.
+    """
+    condiciones = []
+    for cond in (c.strip() for c in desc_cruda.split('AND')):
+        match = PATRON_INTERVALO.search(cond)
+        if not match:
+            condiciones.append({'texto': cond})
+            continue
+
+        limite_inferior, variable, limite_superior = match.groups()
+        li, ls = float(limite_inferior), float(limite_superior)
+        info_variable = data_desc.get(variable, {})
+        valores_posibles = [try_convert(v) for v in info_variable.get('Valores', [])]
+        etiquetas_valores = info_variable.get('Etiquetas', [])
+
+        # Los valores numéricos se filtran por el rango; los no numéricos
+        # (ej: '25-64') se listan siempre.
+        categorias = tuple(
+            (val, etiq)
+            for val, etiq in zip(valores_posibles, etiquetas_valores)
+            if not isinstance(val, (int, float)) or li <= val <= ls
+        )
+
+        cambio = {}
+        for d in nuevo_diccionario.get(variable, ()):
+            cambio.update(d)
+
+        condiciones.append(
+            {
+                'variable': variable,
+                'limite_inferior': limite_inferior,
+                'limite_superior': limite_superior,
+                'inferior': li,
+                'superior': ls,
+                'descripcion': info_variable.get('Descripción', ''),
+                'categorias': categorias,
+                'cambio': cambio,
+            }
+        )
+    return {'descripcion': desc_cruda, 'condiciones': condiciones}
+
+
+def compilar_reglas_cluster(descripciones, data_desc, nuevo_diccionario):
+    """Compila cada descripción distinta: {cluster_descripcion: regla}."""
+    return {
+        desc: compilar_regla_cluster(desc, data_desc, nuevo_diccionario)
+        for desc in dict.fromkeys(descripciones)
+    }
+
 
 def construir_descripciones_cluster(
     variables_cambio,
@@ -7,7 +118,8 @@ def construir_descripciones_cluster(
     nuevo_diccionario,
     language='es',
     show_N_probabilidad=True,
-    show_Probabilidad=True
+    show_Probabilidad=True,
+    reglas_compiladas=None
 ):
     """
     Construye descripciones concisas de cada 'cluster_descripcion' en variables_cambio.
@@ -39,6 +151,9 @@ def construir_descripciones_cluster(
         Si True, se muestra el valor de 'cluster_N_Proba' de cada cluster.
     show_Probabilidad : bool, opcional
         Si True, se muestra la 'cluster_ef_sample' de cada cluster.
+    reglas_compiladas : dict, opcional
+        Salida de compilar_reglas_cluster ({cluster_descripcion: regla}). Las
+        descripciones que no estén ahí se compilan en el momento.
 
     Retorna
     -------
@@ -47,168 +162,83 @@ def construir_descripciones_cluster(
         y cuyo valor es un string descriptivo (en el idioma seleccionado).
     """
 
-    # Función auxiliar para intentar convertir valores a int o float
-    def try_convert(val):
-        try:
-            return int(val)
-        except ValueError:
-            try:
-                return float(val)
-            except ValueError:
-                return val  # Retorna el valor original si no es numérico
-
-    # Mensajes en español/inglés según el parámetro `language`
-    if language == 'es':
-        txt_cluster = "Cluster"
-        txt_original = "Descripción original"
-        txt_condiciones = "Variables y rangos:"
-        txt_prob = "Probabilidad"
-        txt_conf = "Nivel de confianza (Baja:0, Alta 3)"
-        txt_N_prob = "Incremento de probabilidad respecto a la media"
-        txt_variable = "Variable"
-        txt_range = "Rango"
-        txt_desc = "Descripción"
-        txt_cat = "Categorías en rango"
-        txt_no_cat = "No categorías identificadas en este rango"
-        txt_puedo = "¿Puedo cambiarlo yo?"
-        txt_gob = "¿Puede cambiarlo el gobierno?"
-        txt_invol = "Involucrados"
-        txt_recursos = "Recursos"
-    else:
-        txt_cluster = "Group"
-        txt_original = "Original description"
-        txt_condiciones = "Variables and ranges:"
-        txt_prob = "Probability"
-        txt_conf = "Confidence Level (Low: 0, High: 3)"
-        txt_N_prob = "Probability increment over average"
-        txt_variable = "Variable"
-        txt_range = "Range"
-        txt_desc = "Description"
-        txt_cat = "Categories in range"
-        txt_no_cat = "No categories identified in this range"
-        txt_puedo = "Can I change it?"
-        txt_gob = "Can the government change it?"
-        txt_invol = "Involved"
-        txt_recursos = "Resources"
-
-    # Regex para extraer límites y variable:
-    # Ejemplo: "2.5 <= p133 - Ingreso total... <= 10.0"
-    patron_intervalo = re.compile(
-        r'([0-9.]+)\s*<=\s*(p[\w\d]+)\s*-\s*(.*?)\s*<=\s*([0-9.]+)'
-    )
-    patron_intervalo = re.compile(
-        r'([+\-]?\d+(?:\.\d+)?)\s*<=\s*([^\s]+)\s*<=\s*([+\-]?\d+(?:\.\d+)?)'
-    )
-
-    descripciones_por_cluster = {}
-
-    for idx, row in variables_cambio.iterrows():
-        desc_cruda = row['cluster_descripcion']
+    textos = TEXTOS[language if language == 'es' else 'en']
+    reglas_compiladas = reglas_compiladas or {}
+    columnas = variables_cambio.columns
 
-        # Extraer N_probabilidad y Probabilidad (si existen)
-        n_prob_value = row.get('cluster_N_Proba', None)
-        prob_value = row.get('cluster_ef_sample', None)
-        n_samp_val = row.get('cluster_n_sample', None)
+    def columna(nombre):
+        if nombre in columnas:
+            return variables_cambio[nombre].tolist()
+        return [None] * len(variables_cambio)
 
-        conf_val = str(row.get('nivel_de_confianza_cluster', None))
+    descripciones_por_cluster = {}
 
-        # Dividir en sub-condiciones por "AND"
-        condiciones = [c.strip() for c in desc_cruda.split('AND')]
+    for idx, desc_cruda, n_prob_value, prob_value, n_samp_val, conf_val in zip(
+        variables_cambio.index,
+        variables_cambio['cluster_descripcion'],
+        columna('cluster_N_Proba'),
+        columna('cluster_ef_sample'),
+        columna('cluster_n_sample'),
+        columna('nivel_de_confianza_cluster'),
+    ):
+        regla = reglas_compiladas.get(desc_cruda)
+        if regla is None:
+            regla = compilar_regla_cluster(desc_cruda, data_desc, nuevo_diccionario)
 
         # Construir un encabezado conciso
         texto = []
         # Ej: "**Cluster 1**" o "**Group 1**"
-        texto.append(f"**{txt_cluster} {idx}**")
+        texto.append(f"**{textos['cluster']} {idx}**")
 
         # Mostrar N_probabilidad y Probabilidad si se pide
         if show_N_probabilidad and (n_prob_value is not None):
-            texto.append(f"- {txt_N_prob}: {n_prob_value:.2f}")
+            texto.append(f"- {textos['N_prob']}: {n_prob_value:.2f}")
         if show_Probabilidad and (prob_value is not None):
             # Asumimos que Probabilidad es un decimal de 0 a 1. Mostramos en porcentaje.
-            texto.append(f"- {txt_prob}: {prob_value:.1%}")
+            texto.append(f"- {textos['prob']}: {prob_value:.1%}")
 
-        texto.append(f"- {txt_conf}: {conf_val} ({n_samp_val} obs)")
+        texto.append(f"- {textos['conf']}: {conf_val} ({n_samp_val} obs)")
 
         # Agregar descripción original (concisa)
-        texto.append(f"- {txt_original}: {desc_cruda}")
-        texto.append(f"- {txt_condiciones}")
-
-        # Procesar cada condición
-        for cond in condiciones:
-            match = patron_intervalo.search(cond)
-            if match:
-                limite_inferior, variable, limite_superior = match.groups()
-
-                # Info de data_desc
-                if variable in data_desc:
-                    desc_variable = data_desc[variable].get('Descripción', '')
-                    # Intentar convertir los valores posibles
-                    valores_originales = data_desc[variable].get('Valores', [])
-                    valores_posibles = [try_convert(v) for v in valores_originales]
-                    etiquetas_valores = data_desc[variable].get('Etiquetas', [])
-                else:
-                    desc_variable = ""
-                    valores_posibles = []
-                    etiquetas_valores = []
-
-                # Info de nuevo_diccionario
-                info_extra_plano = {}
-                if variable in nuevo_diccionario:
-                    for d in nuevo_diccionario[variable]:
-                        info_extra_plano.update(d)
-
-                # Construir texto corto de la variable
-                subtexto = []
-                subtexto.append(f"  - {txt_variable}: {variable}")
-
-                # Agregamos su descripción si existe
-                if desc_variable:
-                    subtexto.append(f"    - {txt_desc}: {desc_variable}")
-
-                # Agregar el rango
-                subtexto.append(f"    - {txt_range}: {limite_inferior} a {limite_superior}")
-
-                # Intentar mapear categorías
-                cat_in_range = []
-                for val, etiq in zip(valores_posibles, etiquetas_valores):
-                    # Verificar si 'val' es numérico
-                    if isinstance(val, (int, float)):
-                        try:
-                            li = float(limite_inferior)
-                            ls = float(limite_superior)
-                            if li <= val <= ls:
-                                cat_in_range.append(f"{val}={etiq}")
-                        except:
-                            continue  # En caso de error en conversión, saltar
-                    else:
-                        # Si 'val' es una cadena (ej: '25-64'), verificar superposición
-                        # Esto puede ser complejo; para simplificar, listamos todas las categorías no numéricas
-                        cat_in_range.append(f"{val}={etiq}")
-
-                if cat_in_range:
-                    subtexto.append(f"    - {txt_cat}: {' | '.join(cat_in_range)}")
-                else:
-                    subtexto.append(f"    - {txt_no_cat}")
-
-                # Info extra: ¿Puedo cambiarlo? etc.
-                if 'puedo_cambiarlo_yo' in info_extra_plano:
-                    subtexto.append(f"      - {txt_puedo}: {info_extra_plano['puedo_cambiarlo_yo']}")
-                if 'puede_cambiarlo_gobierno' in info_extra_plano:
-                    subtexto.append(f"      - {txt_gob}: {info_extra_plano['puede_cambiarlo_gobierno']}")
-                if 'involucrados' in info_extra_plano:
-                    inv_str = ', '.join(info_extra_plano['involucrados'])
-                    subtexto.append(f"      - {txt_invol}: {inv_str}")
-                if 'recursos_necesarios' in info_extra_plano:
-                    rec_str = ', '.join(info_extra_plano['recursos_necesarios'])
-                    subtexto.append(f"      - {txt_recursos}: {rec_str}")
-
-                # Unir y agregar al texto global
-                texto.extend(subtexto)
-            else:
-                # Si no se parseó (formato distinto)
-                texto.append(f"  - {cond}")
+        texto.append(f"- {textos['original']}: {desc_cruda}")
+        texto.append(f"- {textos['condiciones']}")
+        texto.extend(formatear_condiciones(regla, language))
 
         # Unir todo el texto en un solo bloque
         descripciones_por_cluster[idx] = "\n".join(texto)
 
     return descripciones_por_cluster
+
+
+def formatear_condiciones(regla, language='es'):
+    """Líneas de texto de las condiciones de una regla compilada."""
+    textos = TEXTOS[language if language == 'es' else 'en']
+    lineas = []
+    for cond in regla['condiciones']:
+        if 'variable' not in cond:
+            # Si no se parseó (formato distinto)
+            lineas.append(f"  - {cond['texto']}")
+            continue
+
+        lineas.append(f"  - {textos['variable']}: {cond['variable']}")
+        if cond['descripcion']:
+            lineas.append(f"    - {textos['desc']}: {cond['descripcion']}")
+        lineas.append(
+            f"    - {textos['range']}: {cond['limite_inferior']} a {cond['limite_superior']}"
+        )
+        if cond['categorias']:
+            categorias = ' | '.join(f"{val}={etiq}" for val, etiq in cond['categorias'])
+            lineas.append(f"    - {textos['cat']}: {categorias}")
+        else:
+            lineas.append(f"    - {textos['no_cat']}")
+
+        cambio = cond['cambio']
+        if 'puedo_cambiarlo_yo' in cambio:
+            lineas.append(f"      - {textos['puedo']}: {cambio['puedo_cambiarlo_yo']}")
+        if 'puede_cambiarlo_gobierno' in cambio:
+            lineas.append(f"      - {textos['gob']}: {cambio['puede_cambiarlo_gobierno']}")
+        if 'involucrados' in cambio:
+            lineas.append(f"      - {textos['invol']}: {', '.join(cambio['involucrados'])}")
+        if 'recursos_necesarios' in cambio:
+            lineas.append(f"      - {textos['recursos']}: {', '.join(cambio['recursos_necesarios'])}")
+    return lineas
@@ -0,0 +1,181 @@
+import math
+
+import numpy as np
+
+# Intervalos de confianza para proporciones binomiales, vectorizados.
+# Todas las funciones reciben éxitos y totales (escalares o arreglos del mismo
+# tamaño) y devuelven (inferior, superior) en porcentaje (0-100). Si la
+# entrada es escalar se devuelven floats; si n <= 0 el intervalo es (0, 0).
+
+
+def _prepare(successes, n):
+    successes = np.asarray(successes, dtype="float64")
+    n = np.asarray(n, dtype="float64")
+    successes, n = np.broadcast_arrays(successes, n)
+    return successes, n, n > 0
+
+
+def _finish(lower, upper, valid, scalar):
+    lower = np.where(valid, np.maximum(0.0, lower), 0.0) * 100
+    upper = np.where(valid, np.minimum(1.0, upper), 0.0) * 100
+    if scalar:
+        return float(lower), float(upper)
+    return lower, upper
+
+
+def _alpha_from_z(z):
+    """Nivel de significancia bilateral correspondiente a z (1.96 -> 0.05)."""
+    return math.erfc(z / math.sqrt(2))
+
+
+def wilson_ci(successes, n, z=1.96):
+    scalar = np.ndim(successes) == 0 and np.ndim(n) == 0
+    successes, n, valid = _prepare(successes, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / n
+        denom = 1 + z**2 / n
+        center = (p + z**2 / (2 * n)) / denom
+        margin = (
+            z
+            * np.sqrt((p * (1 - p) / n) + (z**2 / (4 * n**2)))
+            / denom
+        )
+    return _finish(center - margin, center + margin, valid, scalar)
+
+
+def agresti_coull_ci(successes, n, z=1.96):
+    scalar = np.ndim(successes) == 0 and np.ndim(n) == 0
+    successes, n, valid = _prepare(successes, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n_tilde = n + z**2
+        p_tilde = (successes + z**2 / 2) / n_tilde
+        margin = z * np.sqrt(p_tilde * (1 - p_tilde) / n_tilde)
+    return _finish(p_tilde - margin, p_tilde + margin, valid, scalar)
+
+
+_lgamma = np.vectorize(math.lgamma, otypes=[float])
+
+
+def _beta_continued_fraction(a, b, x, max_iter=1000, eps=3e-14):
+    """Fracción continua de la beta incompleta (método de Lentz), vectorizada."""
+    tiny = 1e-300
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+    c = np.ones_like(x)
+    d = 1 - qab * x / qap
+    d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+    h = d.copy()
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+        c = 1 + aa / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+        c = 1 + aa / c
+        c = np.where(np.abs(c) < tiny, tiny, c)
+        delta = d * c
+        h *= delta
+        if np.all(np.abs(delta - 1) < eps):
+            break
+    return h
+
+
+def beta_cdf(x, a, b):
+    """Función de distribución de la Beta(a, b) (beta incompleta regularizada)."""
+    x, a, b = np.broadcast_arrays(
+        np.asarray(x, dtype="float64"),
+        np.asarray(a, dtype="float64"),
+        np.asarray(b, dtype="float64"),
+    )
+    xc = np.clip(x, 1e-300, 1 - 1e-16)
+    log_front = (
+        _lgamma(a + b) - _lgamma(a) - _lgamma(b)
+        + a * np.log(xc) + b * np.log1p(-xc)
+    )
+    front = np.exp(log_front)
+    swap = xc > (a + 1) / (a + b + 2)
+    cf = _beta_continued_fraction(
+        np.where(swap, b, a),
+        np.where(swap, a, b),
+        np.where(swap, 1 - xc, xc),
+    )
+    result = np.where(swap, 1 - front * cf / b, front * cf / a)
+    result = np.where(x <= 0, 0.0, result)
+    return np.where(x >= 1, 1.0, result)
+
+
+def beta_ppf(q, a, b, iterations=50):
+    """Cuantil de la Beta(a, b) por bisección vectorizada (precisión ~1e-15)."""
+    q, a, b = np.broadcast_arrays(
+        np.asarray(q, dtype="float64"),
+        np.asarray(a, dtype="float64"),
+        np.asarray(b, dtype="float64"),
+    )
+    lo = np.zeros(q.shape)
+    hi = np.ones(q.shape)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        below = beta_cdf(mid, a, b) < q
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return (lo + hi) / 2
+
+
+def clopper_pearson_ci(successes, n, z=1.96):
+    """Intervalo exacto de Clopper-Pearson con cuantiles beta propios (sin scipy)."""
+    scalar = np.ndim(successes) == 0 and np.ndim(n) == 0
+    successes, n, valid = _prepare(successes, n)
+    alpha = _alpha_from_z(z)
+    # Parámetros seguros para filas sin cálculo (x = 0, x = n o n <= 0).
+    safe_n = np.where(valid, n, 1.0)
+    x = np.clip(successes, 0, safe_n)
+    has_lower = valid & (x > 0)
+    has_upper = valid & (x < safe_n)
+    lower = np.zeros(x.shape)
+    upper = np.ones(x.shape)
+    if has_lower.any():
+        lower[has_lower] = beta_ppf(
+            alpha / 2, x[has_lower], safe_n[has_lower] - x[has_lower] + 1
+        )
+    if has_upper.any():
+        upper[has_upper] = beta_ppf(
+            1 - alpha / 2, x[has_upper] + 1, safe_n[has_upper] - x[has_upper]
+        )
+    return _finish(lower, upper, valid, scalar)
+
+
+def bootstrap_ci(successes, n, z=1.96, n_boot=2000, seed=0):
+    """
+    Bootstrap paramétrico: n_boot remuestreos binomiales de todos los puntos
+    en una sola llamada. La semilla fija mantiene estables las gráficas.
+    """
+    scalar = np.ndim(successes) == 0 and np.ndim(n) == 0
+    successes, n, valid = _prepare(successes, n)
+    alpha = _alpha_from_z(z)
+    safe_n = np.where(valid, n, 1.0).astype("int64")
+    p = np.clip(np.where(valid, successes / safe_n, 0.0), 0.0, 1.0)
+    rng = np.random.default_rng(seed)
+    draws = rng.binomial(safe_n, p, size=(n_boot,) + p.shape) / safe_n
+    lower, upper = np.quantile(draws, [alpha / 2, 1 - alpha / 2], axis=0)
+    return _finish(lower, upper, valid, scalar)
+
+
+CI_METHODS = {
+    "wilson": wilson_ci,
+    "agresti_coull": agresti_coull_ci,
+    "clopper_pearson": clopper_pearson_ci,
+    "bootstrap": bootstrap_ci,
+}
+
+
+def proportion_ci(successes, n, method="wilson", z=1.96):
+    """Intervalo para proporciones con el método indicado (ver CI_METHODS)."""
+    if method not in CI_METHODS:
+        raise ValueError(f"Método de intervalo desconocido: {method}")
+    return CI_METHODS[method](successes, n, z=z)
@@ -0,0 +1,308 @@
+import hashlib
+import json
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.impute import SimpleImputer
+from sklearn.neighbors import NearestNeighbors
+from sklearn.preprocessing import StandardScaler
+
+# Índices KNN pre-entrenados para la Sección 4: por cada target se ajustan
+# una sola vez el imputador, el escalador y el buscador de vecinos sobre las
+# filas con cluster != -1 y las preguntas del cuestionario de ese target.
+#
+# Backends de búsqueda (KNN_BACKENDS):
+# - "exact": NearestNeighbors euclidiano con algoritmo automático (comportamiento original).
+# - "brute", "kd_tree", "ball_tree": NearestNeighbors con el algoritmo fijo (también exactos).
+# - "ivf": aproximado en NumPy puro; k-means como cuantizador grueso y búsqueda
+#   exacta solo dentro de las n_probe listas más cercanas a cada consulta.
+#
+# Cada backend (y cada combinación de parámetros de IVF) se guarda en su
+# propio archivo, ver knn_index_filename.
+
+KNN_INDEX_PREFIX = "section4_knn_index"
+KNN_INDEX_VERSION = 2
+KNN_BACKENDS = ("exact", "brute", "kd_tree", "ball_tree", "ivf")
+DEFAULT_KNN_BACKEND = "exact"
+IVF_PARAMS = ("n_lists", "n_probe", "n_iter", "sample_size", "seed")
+SOURCE_FILES = ("df_clusterizados_total_origi.csv", "df_feature_importances_total.joblib")
+
+
+def check_backend_params(backend, backend_params):
+    """Valida el backend y sus parámetros: solo "ivf" acepta parámetros (IVF_PARAMS)."""
+    if backend not in KNN_BACKENDS:
+        raise ValueError(f"Backend KNN desconocido: {backend}")
+    allowed = IVF_PARAMS if backend == "ivf" else ()
+    unknown = sorted(set(backend_params) - set(allowed))
+    if unknown:
+        raise ValueError(f"Parámetros no válidos para el backend {backend}: {', '.join(unknown)}")
+
+
+def knn_index_filename(backend=DEFAULT_KNN_BACKEND, **backend_params):
+    """
+    Nombre del archivo de índices del backend, p. ej. section4_knn_index_exact.joblib
+    o section4_knn_index_ivf_n_lists-256_n_probe-8.joblib.
+    """
+    check_backend_params(backend, backend_params)
+    parts = [KNN_INDEX_PREFIX, backend]
+    parts += [f"{name}-{backend_params[name]}" for name in sorted(backend_params)]
+    return "_".join(parts) + ".joblib"
+
+
+def assets_fingerprint(base_path="data", backend=DEFAULT_KNN_BACKEND, backend_params=None):
+    """
+    Huella del contenido de los artefactos de los que depende el índice, más la
+    versión del índice y de scikit-learn (los pickles no son portables entre
+    versiones) y el backend con sus parámetros.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{KNN_INDEX_VERSION}|{sklearn.__version__}".encode("utf-8"))
+    digest.update(
+        json.dumps([backend, backend_params or {}], sort_keys=True, default=str).encode("utf-8")
+    )
+    for name in SOURCE_FILES:
+        digest.update((Path(base_path) / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _squared_distances(A, B, chunk_size=4096):
+    """Distancias euclidianas al cuadrado entre filas de A y B, por bloques de A."""
+    B_norm = (B**2).sum(axis=1)
+    out = np.empty((len(A), len(B)))
+    for start in range(0, len(A), chunk_size):
+        block = A[start:start + chunk_size]
+        out[start:start + chunk_size] = (
+            (block**2).sum(axis=1)[:, None] - 2 * block @ B.T + B_norm
+        )
+    return np.maximum(out, 0.0)
+
+
+def _nearest_centroid(X, centroids, chunk_size=4096):
+    return np.concatenate(
+        [
+            _squared_distances(X[start:start + chunk_size], centroids).argmin(axis=1)
+            for start in range(0, len(X), chunk_size)
+        ]
+    )
+
+
+def fit_ivf(X, n_lists=None, n_probe=8, n_iter=10, sample_size=20_000, seed=0):
+    """
+    Índice IVF: k-means (Lloyd, n_iter pasos sobre una muestra de sample_size
+    filas) con n_lists centroides (por defecto sqrt(N)); los puntos se guardan
+    ordenados por lista. n_probe listas se revisan por consulta.
+    """
+    X = np.asarray(X, dtype="float64")
+    n_lists = min(len(X), n_lists or max(1, int(np.sqrt(len(X)))))
+    rng = np.random.default_rng(seed)
+    sample = X[rng.choice(len(X), min(len(X), sample_size), replace=False)]
+    centroids = sample[:n_lists].copy()
+    for _ in range(n_iter):
+        assign = _nearest_centroid(sample, centroids)
+        sizes = np.bincount(assign, minlength=n_lists)
+        sums = np.column_stack(
+            [
+                np.bincount(assign, weights=sample[:, j], minlength=n_lists)
+                for j in range(sample.shape[1])
+            ]
+        )
+        nonempty = sizes > 0
+        centroids[nonempty] = sums[nonempty] / sizes[nonempty, None]
+    assign = _nearest_centroid(X, centroids)
+    order = np.argsort(assign, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=n_lists))])
+    return {
+        "centroids": centroids,
+        "data": X[order],
+        "ids": order,
+        "offsets": offsets,
+        "n_probe": n_probe,
+    }
+
+
+def query_ivf(ivf, queries, n_neighbors, n_probe=None):
+    """Misma salida que NearestNeighbors.kneighbors: (distancias, posiciones)."""
+    queries = np.asarray(queries, dtype="float64")
+    n_probe = min(n_probe or ivf["n_probe"], len(ivf["centroids"]))
+    offsets = ivf["offsets"]
+    probes = np.argsort(_squared_distances(queries, ivf["centroids"]), axis=1)[:, :n_probe]
+    distances = np.empty((len(queries), n_neighbors))
+    indices = np.empty((len(queries), n_neighbors), dtype="int64")
+    for row, (query, lists) in enumerate(zip(queries, probes)):
+        candidates = np.concatenate(
+            [np.arange(offsets[lst], offsets[lst + 1]) for lst in lists]
+        )
+        if len(candidates) < n_neighbors:
+            candidates = np.arange(len(ivf["ids"]))
+        dist = ((ivf["data"][candidates] - query) ** 2).sum(axis=1)
+        top = np.argpartition(dist, n_neighbors - 1)[:n_neighbors]
+        top = top[np.argsort(dist[top], kind="stable")]
+        distances[row] = np.sqrt(dist[top])
+        indices[row] = ivf["ids"][candidates[top]]
+    return distances, indices
+
+
+def fit_knn_index(X, clusters, variables, backend=DEFAULT_KNN_BACKEND, **backend_params):
+    """
+    Ajusta imputador (media), escalador y el buscador de vecinos del backend
+    indicado sobre X (filas válidas x variables). Devuelve el índice listo
+    para consultar. backend_params se pasan a fit_ivf (n_lists, n_probe, ...);
+    lanza ValueError si el backend no los acepta.
+    """
+    check_backend_params(backend, backend_params)
+    imputer = SimpleImputer(strategy="mean")
+    X = imputer.fit_transform(X)
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X)
+    if backend == "ivf":
+        knn = fit_ivf(X_scaled, **backend_params)
+    else:
+        algorithm = "auto" if backend == "exact" else backend
+        knn = NearestNeighbors(metric="euclidean", algorithm=algorithm)
+        knn.fit(X_scaled)
+    return {
+        "variables": list(variables),
+        "backend": backend,
+        "imputer": imputer,
+        "scaler": scaler,
+        "knn": knn,
+        "clusters": np.asarray(clusters),
+    }
+
+
+def query_knn_index(index, user_matrix, n_vecinos):
+    """
+    Transforma las respuestas (una fila por cuestionario, columnas en el orden
+    de index["variables"]) y devuelve (distancias, posiciones) de los vecinos.
+    """
+    user_matrix = np.asarray(user_matrix, dtype="float64")
+    user_scaled = index["scaler"].transform(index["imputer"].transform(user_matrix))
+    if index.get("backend") == "ivf":
+        return query_ivf(index["knn"], user_scaled, n_vecinos)
+    return index["knn"].kneighbors(user_scaled, n_neighbors=n_vecinos)
+
+
+def knn_recall_at_k(index, exact_index, user_matrix, k):
+    """
+    Recall@k de un índice frente al exacto. Un vecino cuenta como acierto si
+    su distancia no supera la k-ésima distancia exacta, así los empates
+    (frecuentes con respuestas categóricas) no penalizan.
+    """
+    exact_dist, _ = query_knn_index(exact_index, user_matrix, k)
+    dist, _ = query_knn_index(index, user_matrix, k)
+    return float((dist <= exact_dist[:, -1:] + 1e-9).mean())
+
+
+def neighbour_cluster_counts(index, user_matrix, n_vecinos):
+    """
+    Conteo de clusters entre los vecinos de cada fila de user_matrix con una sola
+    llamada a kneighbors. Devuelve un DataFrame largo con columnas
+    ["fila", "cluster", "count"] (solo conteos > 0).
+    """
+    user_matrix = np.atleast_2d(np.asarray(user_matrix, dtype="float64"))
+    _, indices = query_knn_index(index, user_matrix, n_vecinos)
+    labels, codes = np.unique(index["clusters"], return_inverse=True)
+    n_rows, n_labels = len(user_matrix), len(labels)
+    # Una celda por (fila, cluster): bincount sobre el código aplanado.
+    flat = (np.arange(n_rows)[:, None] * n_labels + codes[indices]).ravel()
+    counts = np.bincount(flat, minlength=n_rows * n_labels).reshape(n_rows, n_labels)
+    filas, posiciones = np.nonzero(counts)
+    return pd.DataFrame(
+        {
+            "fila": filas,
+            "cluster": labels[posiciones],
+            "count": counts[filas, posiciones],
+        }
+    )
+
+
+def build_knn_indexes(projections, question_sets, backend=DEFAULT_KNN_BACKEND, **backend_params):
+    """
+    projections: {target: {"X", "clusters", "columns"}} con solo las filas
+    cluster != -1 (ver section4.build_target_projections).
+    question_sets: {target: [variables del cuestionario]}.
+    Devuelve {target: índice}.
+    """
+    indexes = {}
+    for target, variables in question_sets.items():
+        proyeccion = projections[target]
+        positions = [proyeccion["columns"][var] for var in variables]
+        indexes[target] = fit_knn_index(
+            proyeccion["X"][:, positions],
+            proyeccion["clusters"],
+            variables,
+            backend=backend,
+            **backend_params,
+        )
+    return indexes
+
+
+def knn_index_path(base_path="data", backend=DEFAULT_KNN_BACKEND, **backend_params):
+    return Path(base_path) / knn_index_filename(backend, **backend_params)
+
+
+def save_knn_indexes(indexes, base_path="data", backend=DEFAULT_KNN_BACKEND, **backend_params):
+    path = knn_index_path(base_path, backend, **backend_params)
+    joblib.dump(
+        {
+            "fingerprint": assets_fingerprint(base_path, backend, backend_params),
+            "backend": backend,
+            "backend_params": backend_params,
+            "indexes": indexes,
+        },
+        path,
+    )
+    return path
+
+
+def load_knn_indexes_file(base_path="data", backend=DEFAULT_KNN_BACKEND, **backend_params):
+    """
+    Carga los índices persistidos. Devuelve None si no existen o si fueron
+    construidos con otros artefactos/versión de scikit-learn, otro backend u
+    otros parámetros.
+    """
+    path = knn_index_path(base_path, backend, **backend_params)
+    if not path.exists():
+        return None
+    try:
+        payload = joblib.load(path)
+    except Exception:
+        return None
+    if payload.get("fingerprint") != assets_fingerprint(base_path, backend, backend_params):
+        return None
+    return payload["indexes"]
+
+
+def parse_backend_params(args):
+    """["n_lists=256", "n_probe=8"] -> {"n_lists": 256, "n_probe": 8} (valores enteros)."""
+    params = {}
+    for arg in args:
+        name, sep, value = arg.partition("=")
+        if not sep:
+            raise ValueError(f"Parámetro sin valor: {arg} (usar nombre=valor)")
+        params[name] = int(value)
+    return params
+
+
+def main():
+    """Paso offline: python -m utils.knn_s4 [ruta_data] [backend] [param=valor ...]"""
+    import sys
+
+    from section4 import build_section4_knn_indexes, load_section4_assets
+
+    base_path = sys.argv[1] if len(sys.argv) > 1 else "data"
+    backend = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_KNN_BACKEND
+    backend_params = parse_backend_params(sys.argv[3:])
+    check_backend_params(backend, backend_params)
+    indexes = build_section4_knn_indexes(
+        load_section4_assets(base_path), backend=backend, **backend_params
+    )
+    path = save_knn_indexes(indexes, base_path, backend=backend, **backend_params)
+    print(f"{len(indexes)} índices ({backend}) guardados en {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import threading
+from collections.abc import Mapping
+
+# Contenedores de carga perezosa compartidos por los módulos de artefactos
+# (utils/store_s4.py) y el registro de modelos (model_registry.py).
+
+
+class LazyAssets(Mapping):
+    """
+    Mapping de solo lectura sobre {llave: función de carga}; cada valor se
+    lee la primera vez que se pide (con lock para hilos).
+    """
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            with self._lock:
+                if key not in self._values:
+                    self._values[key] = self._loaders[key]()
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def loaded(self):
+        """Valores ya leídos, sin disparar la carga de los demás."""
+        return dict(self._values)
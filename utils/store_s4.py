@@ -0,0 +1,265 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pyarrow import feather
+
+from utils.lazy import LazyAssets
+
+# Almacén binario de los artefactos de la Sección 4 (data/cache/section4/):
+# - Feather sin compresión (Arrow IPC, se lee con memory map) para los DataFrames;
+#   las columnas con dicts de df_valiosas_dict se guardan como texto JSON.
+# - .npy para las proyecciones por target (np.load con mmap_mode="r"), así
+#   varios procesos del mismo host comparten las páginas del sistema operativo.
+# - schema.json: columnas, dtypes, columnas JSON e índice de cada tabla.
+# - manifest.json: sha256 y tamaño de cada archivo más dos huellas de las
+#   fuentes: la del contenido (sha256, se calcula al construir) y la de
+#   nombre/tamaño/mtime, que es la que se compara al abrir el almacén para no
+#   releer las fuentes en cada arranque.
+
+STORE_DIRNAME = "cache/section4"
+STORE_VERSION = 1
+SOURCE_FILES = (
+    "df_valiosas_dict.joblib",
+    "df_feature_importances_total.joblib",
+    "df_clusterizados_total_origi.csv",
+)
+
+
+def store_path(base_path="data"):
+    return Path(base_path) / STORE_DIRNAME
+
+
+def sources_fingerprint(base_path="data"):
+    """
+    Huella del contenido de las fuentes más STORE_VERSION (paso offline). None
+    si alguna no está (despliegue solo con el almacén binario).
+    """
+    digest = hashlib.sha256(f"{STORE_VERSION}".encode("utf-8"))
+    for name in SOURCE_FILES:
+        path = Path(base_path) / name
+        if not path.exists():
+            return None
+        digest.update(bytes.fromhex(file_sha256(path)))
+    return digest.hexdigest()[:16]
+
+
+def sources_stat_fingerprint(base_path="data"):
+    """
+    Huella barata de las fuentes (nombre, tamaño y mtime) más STORE_VERSION,
+    como data_utils.source_fingerprint. None si alguna no está.
+    """
+    parts = {"store_version": STORE_VERSION, "sources": []}
+    for name in SOURCE_FILES:
+        path = Path(base_path) / name
+        if not path.exists():
+            return None
+        stat = path.stat()
+        parts["sources"].append([name, stat.st_size, stat.st_mtime_ns])
+    payload = json.dumps(parts, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_table(df, path):
+    """Guarda un DataFrame en Feather y devuelve su esquema."""
+    json_columns = [
+        col
+        for col in df.columns
+        if df[col].dtype == object and df[col].map(lambda v: isinstance(v, (dict, list))).any()
+    ]
+    index_name = None
+    index_dtype = None
+    if not isinstance(df.index, pd.RangeIndex) or df.index.start != 0 or df.index.step != 1:
+        index_name = df.index.name or "__index__"
+        index_dtype = str(df.index.dtype)
+        df = df.reset_index(names=index_name)
+    if json_columns:
+        df = df.assign(
+            **{col: df[col].map(lambda v: json.dumps(v, ensure_ascii=False)) for col in json_columns}
+        )
+    df.to_feather(path, compression="uncompressed")
+    return {
+        "file": path.name,
+        "columns": [col for col in df.columns if col != index_name],
+        "dtypes": {
+            col: str(dtype) for col, dtype in df.dtypes.items() if col != index_name
+        },
+        "json_columns": json_columns,
+        "columns_dtype": str(df.columns.dtype),
+        "index": index_name,
+        "index_dtype": index_dtype,
+    }
+
+
+def _read_table(directory, schema):
+    df = feather.read_table(directory / schema["file"], memory_map=True).to_pandas()
+    if schema["index"] is not None:
+        df = df.set_index(schema["index"])
+        if schema["index_dtype"] == "object":
+            df.index = df.index.astype(object)
+        if schema["index"] == "__index__":
+            df.index.name = None
+    for col in schema["json_columns"]:
+        df[col] = df[col].map(json.loads).astype(object)
+    for col, dtype in schema["dtypes"].items():
+        if dtype == "object" and col not in schema["json_columns"]:
+            df[col] = df[col].astype(object)
+    df = df[schema["columns"]]
+    if schema["columns_dtype"] == "object":
+        df.columns = df.columns.astype(object)
+    return df
+
+
+def write_section4_store(assets, base_path="data"):
+    """
+    Convierte el dict de load_section4_assets al almacén binario. Se escribe
+    en un directorio temporal y se reemplaza al final para no dejar un
+    almacén a medias visible a otros procesos.
+    """
+    final_dir = store_path(base_path)
+    final_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=final_dir.parent, prefix=".section4_"))
+    os.chmod(tmp_dir, 0o755)
+    try:
+        schema = {
+            "df_clusterizados_total_origi": _write_table(
+                assets["df_clusterizados_total_origi"], tmp_dir / "clusterizados.arrow"
+            ),
+            "df_feature_importances_total": _write_table(
+                assets["df_feature_importances_total"], tmp_dir / "importancias.arrow"
+            ),
+            "df_valiosas_dict": {},
+            "target_projections": {},
+        }
+        for pos, (target, df) in enumerate(assets["df_valiosas_dict"].items()):
+            schema["df_valiosas_dict"][target] = _write_table(df, tmp_dir / f"valiosas_{pos}.arrow")
+        for pos, (target, proyeccion) in enumerate(assets["target_projections"].items()):
+            np.save(tmp_dir / f"proyeccion_{pos}_X.npy", np.ascontiguousarray(proyeccion["X"]))
+            np.save(tmp_dir / f"proyeccion_{pos}_clusters.npy", np.asarray(proyeccion["clusters"]))
+            schema["target_projections"][target] = {
+                "X": f"proyeccion_{pos}_X.npy",
+                "clusters": f"proyeccion_{pos}_clusters.npy",
+                "columns": list(proyeccion["columns"]),
+            }
+        (tmp_dir / "schema.json").write_text(
+            json.dumps(schema, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        manifest = {
+            "store_version": STORE_VERSION,
+            "sources_fingerprint": sources_fingerprint(base_path),
+            "sources_stat": sources_stat_fingerprint(base_path),
+            "files": {
+                path.name: {"sha256": file_sha256(path), "bytes": path.stat().st_size}
+                for path in sorted(tmp_dir.iterdir())
+            },
+        }
+        (tmp_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        old_dir = None
+        if final_dir.exists():
+            old_dir = final_dir.with_name(f"{tmp_dir.name}_old")
+            os.replace(final_dir, old_dir)
+        os.replace(tmp_dir, final_dir)
+        if old_dir is not None:
+            shutil.rmtree(old_dir, ignore_errors=True)
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    return final_dir
+
+
+def verify_section4_store(base_path="data"):
+    """Lista de archivos del almacén cuyo tamaño o sha256 no coincide con el manifiesto."""
+    directory = store_path(base_path)
+    manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+    bad = []
+    for name, meta in manifest["files"].items():
+        path = directory / name
+        if not path.exists() or path.stat().st_size != meta["bytes"] or file_sha256(path) != meta["sha256"]:
+            bad.append(name)
+    return bad
+
+
+def load_section4_store(base_path="data", verify=False):
+    """
+    Abre el almacén binario de forma perezosa (LazyAssets con las mismas
+    llaves que load_section4_assets). Devuelve None si no existe,
+    si el formato cambió, si las fuentes presentes no coinciden con las que lo
+    generaron o, con verify=True, si algún checksum no coincide.
+    """
+    directory = store_path(base_path)
+    try:
+        manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+        schema = json.loads((directory / "schema.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("store_version") != STORE_VERSION:
+        return None
+    fingerprint = sources_stat_fingerprint(base_path)
+    if fingerprint is not None and manifest.get("sources_stat") != fingerprint:
+        return None
+    for name, meta in manifest["files"].items():
+        path = directory / name
+        if not path.exists() or path.stat().st_size != meta["bytes"]:
+            return None
+    if verify and verify_section4_store(base_path):
+        return None
+
+    def load_projections():
+        return {
+            target: {
+                "X": np.load(directory / meta["X"], mmap_mode="r"),
+                "clusters": np.load(directory / meta["clusters"], mmap_mode="r"),
+                "columns": {col: pos for pos, col in enumerate(meta["columns"])},
+            }
+            for target, meta in schema["target_projections"].items()
+        }
+
+    return LazyAssets(
+        {
+            "df_valiosas_dict": lambda: {
+                target: _read_table(directory, table)
+                for target, table in schema["df_valiosas_dict"].items()
+            },
+            "df_feature_importances_total": lambda: _read_table(
+                directory, schema["df_feature_importances_total"]
+            ),
+            "df_clusterizados_total_origi": lambda: _read_table(
+                directory, schema["df_clusterizados_total_origi"]
+            ),
+            "target_projections": load_projections,
+        }
+    )
+
+
+def main():
+    """Conversión offline: python -m utils.store_s4 [ruta_data] [--verify]"""
+    import sys
+
+    from section4 import load_section4_sources
+
+    args = [arg for arg in sys.argv[1:] if arg != "--verify"]
+    base_path = args[0] if args else "data"
+    if "--verify" in sys.argv:
+        bad = verify_section4_store(base_path)
+        print("Almacén íntegro" if not bad else f"Checksums distintos: {bad}")
+        return
+    path = write_section4_store(load_section4_sources(base_path), base_path)
+    print(f"Almacén de la Sección 4 escrito en {path}")
+
+
+if __name__ == "__main__":
+    main()